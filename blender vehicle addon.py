@@ -18,8 +18,23 @@ bl_info = {
 }
 
 import bpy
+import bmesh
+import gpu
+import hashlib
+import heapq
+import itertools
 import math
-from mathutils import Vector
+import numpy as np
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from bpy.app.handlers import persistent
+from concurrent.futures import ThreadPoolExecutor
+from gpu_extras.batch import batch_for_shader
+from mathutils import Matrix, Vector
+from mathutils.bvhtree import BVHTree
 
 
 # Reference VW Golf measurements (as used in Arma Reforger examples)
@@ -81,12 +96,1801 @@ EMPTY_LOCATIONS = {
     "dmg_zone_turret": (0, 0, 1.2),  # For military vehicles with turrets
 }
 
+# Maximum number of vertices sampled when detecting the vehicle heading
+ORIENT_SAMPLE_LIMIT = 200000
+
+# Detected length axes within this angle of a world axis are snapped onto it, so only sampling noise is absorbed
+ORIENT_SNAP_ANGLE = math.radians(1.0)
+
+# Search around the principal axis for the tightest footprint: coarse range and step, then a fine step
+ORIENT_REFINE_RANGE = math.radians(15.0)
+ORIENT_REFINE_STEP = math.radians(1.0)
+ORIENT_REFINE_FINE_STEP = math.radians(0.1)
+
+# Combined front/back score that counts as a fully confident heading
+ORIENT_CONFIDENT_SCORE = 0.2
+
+# Headings less confident than this ask the user to check the front
+ORIENT_CONFIDENCE_WARNING = 0.5
+
+# Rotation about Z that turns each forward axis towards +Y
+FORWARD_AXIS_ANGLES = {
+    'POS_Y': 0.0,
+    'NEG_Y': math.pi,
+    'POS_X': math.pi / 2,
+    'NEG_X': -math.pi / 2,
+}
+
+# Directions probed by the hull prefilter: the axes plus face and corner diagonals
+HULL_PREFILTER_DIRECTIONS = np.array(
+    [direction for direction in itertools.product((-1.0, 0.0, 1.0), repeat=3) if any(direction)])
+HULL_PREFILTER_DIRECTIONS /= np.linalg.norm(HULL_PREFILTER_DIRECTIONS, axis=1)[:, None]
+
+# Point sets up to this size go straight to the hull routine
+HULL_PREFILTER_MIN_POINTS = 2000
+
+# Rows processed at once by the prefilter, keeps the (rows x planes) temporaries small
+HULL_PREFILTER_CHUNK = 262144
+
+# Directions the stratified hull sampler keeps extremes along: the axes and corner diagonals
+STRATIFIED_SAMPLE_DIRECTIONS = HULL_PREFILTER_DIRECTIONS[
+    np.count_nonzero(HULL_PREFILTER_DIRECTIONS, axis=1) != 2]
+
+# Voxels along the longest side the stratified sampler starts from, halved until the budget fits
+STRATIFIED_SAMPLE_RESOLUTION = 32
+
+# Points the convex FireGeo hull is built from
+FIREGEO_HULL_POINTS = 1000
+
+# Fewest faces one Detailed FireGeo part gets from the face budget
+DETAILED_MIN_PART_FACES = 12
+
+# A cached Detailed part is reused while its new share of the face budget is within this fraction of the old one
+DETAILED_BUDGET_TOLERANCE = 0.2
+
+# Vertices closer than this are welded before a Detailed FireGeo part is simplified
+DETAILED_WELD_DISTANCE = 0.001
+
+# Clustering grid sizes searched when simplifying a Detailed part, in cells along its longest side.
+# The search starts at 5% of the part size, the old remesh voxel size, and goes coarser or finer from there
+DETAILED_START_RESOLUTION = 20
+DETAILED_MAX_RESOLUTION = 1024
+
+# Outward faces of a box as corner indices, corners ordered like itertools.product over (min, max) per axis
+BOX_CORNER_QUADS = np.array([
+    (0, 1, 3, 2), (4, 6, 7, 5),  # -X, +X
+    (0, 4, 5, 1), (2, 3, 7, 6),  # -Y, +Y
+    (0, 2, 6, 4), (1, 5, 7, 3),  # -Z, +Z
+])
+
+# Seconds a background Detailed FireGeo worker may spend on one part before it is given up on
+DETAILED_WORKER_TIMEOUT = 600
+
+# Command line flag that starts this file as a background Detailed FireGeo worker
+DETAILED_WORKER_FLAG = "--arvehicles-worker"
+
+# Neighbouring hull faces closer to parallel than this are dissolved into one polygon
+HULL_COPLANAR_ANGLE = math.radians(0.01)
+
+# Candidate split planes tried per axis when decomposing a collider into convex parts
+DECOMPOSE_SPLITS_PER_AXIS = 12
+
+# Fewest faces one decomposed part gets from the face budget
+DECOMPOSE_MIN_PART_FACES = 6
+
+# Split and merge passes of the convex decomposition
+DECOMPOSE_ROUNDS = 4
+
+# Rotations tried about each box axis per refinement pass when fitting boxes
+PRIMITIVE_BOX_ANGLES = 12
+PRIMITIVE_BOX_PASSES = 3
+
+# Sides of the polygons approximating cylinder and capsule colliders
+PRIMITIVE_SEGMENTS = 16
+
+# Primitive collider kinds: (name prefix, material name, material color)
+PRIMITIVE_TYPES = {
+    'BOX': ("UBX", "UBX_Material", (0.2, 0.4, 0.9, 0.5)),        # Semi-transparent blue
+    'CYLINDER': ("UCS", "UCS_Material", (0.8, 0.5, 0.0, 0.5)),   # Same orange as the wheels
+    'CAPSULE': ("USP", "USP_Material", (0.6, 0.2, 0.8, 0.5)),    # Semi-transparent purple
+}
+
+# Operators that record their colliders, by generator name
+COLLIDER_OPERATORS = {
+    "UCX": "create_ucx_collision",
+    "FireGeo": "create_firegeo_collision",
+    "Primitive": "create_primitive_colliders",
+}
+
+# UCX collision tiers, from fastest to best fitting
+UCX_TIERS = [
+    ('BOX', "Bounding Box", "Instant box around the vehicle, 6 faces"),
+    ('HULL', "Convex Hull", "Exact convex hull around the whole vehicle, no face limit"),
+    ('SIMPLIFIED', "Simplified Hull", "Convex hull merged down to the target face count"),
+    ('DECOMPOSE', "Convex Decomposition", "Split concave vehicles (open beds, turrets) into several convex parts"),
+]
+
+# Vertices sampled to time a probe hull for the UCX tier estimates
+UCX_PROBE_POINTS = 20000
+
+# Rough costs behind the UCX tier estimates: plane merging per hull face, and a
+# decomposition at resolution 40 (seconds, grows with the cube of the resolution)
+UCX_MERGE_SECONDS_PER_FACE = 1.5e-4
+UCX_DECOMPOSE_SECONDS = 0.5
+
+# Vertex coordinates are read in bulk with foreach_get (float32, the native
+# storage type) and transformed in float64 to keep precision on large vehicles
+def _mesh_local_coords(mesh):
+    """Read all vertex coordinates of a mesh into an (N, 3) array"""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3).astype(np.float64)
+
+def _transform_coords(coords, matrix):
+    """Transform an (N, 3) array of points by a 4x4 matrix"""
+    matrix = np.array(matrix, dtype=np.float64)
+    return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+# Cached world bounds: {mesh pointer: {world matrix key: (bbox_min, bbox_max)}}
+# Entries are dropped by the depsgraph handler when geometry or transform changes
+_bounds_cache = {}
+
+# Last matrix key each object was measured with: {object pointer: (mesh pointer, matrix key)}
+_object_bounds_keys = {}
+
+# Local-space convex hull vertices of meshes shared by several objects: {mesh pointer: (N, 3) array}
+_hull_points_cache = {}
+
+def _matrix_key(matrix):
+    """Hashable key for a 4x4 matrix, rounded to survive float32 loc/rot/scale round trips"""
+    return tuple(round(value, 6) for row in matrix for value in row)
+
+def _mesh_hull_points(mesh):
+    """Get the local-space convex hull vertices of a mesh, computed once per datablock"""
+    mesh_key = mesh.as_pointer()
+    points = _hull_points_cache.get(mesh_key)
+    
+    if points is None:
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        result = bmesh.ops.convex_hull(bm, input=bm.verts)
+        
+        hull_verts = [ele for ele in result["geom"] if isinstance(ele, bmesh.types.BMVert)]
+        has_faces = any(isinstance(ele, bmesh.types.BMFace) for ele in result["geom"])
+        
+        if has_faces and len(hull_verts) >= 4:
+            points = np.array([vert.co for vert in hull_verts], dtype=np.float64)
+        else:
+            # Flat meshes have no volume hull, keep every vertex
+            points = _mesh_local_coords(mesh)
+        
+        bm.free()
+        _hull_points_cache[mesh_key] = points
+    
+    return points
+
+def _mesh_world_bounds(obj, transform=None):
+    """Get (bbox_min, bbox_max) of one mesh object in world space, using the cache"""
+    matrix = obj.matrix_world if transform is None else transform @ obj.matrix_world
+    mesh_key = obj.data.as_pointer()
+    matrix_key = _matrix_key(matrix)
+    mesh_entries = _bounds_cache.setdefault(mesh_key, {})
+    
+    bounds = mesh_entries.get(matrix_key)
+    if bounds is None:
+        # Linked duplicates share one hull: the extreme vertices in any direction
+        # are hull vertices, so transforming only those gives exact bounds
+        if obj.data.users > 1:
+            local_coords = _mesh_hull_points(obj.data)
+        else:
+            local_coords = _mesh_local_coords(obj.data)
+        
+        # One matrix multiply per mesh, then a per-axis reduction
+        world_coords = _transform_coords(local_coords, matrix)
+        bounds = (world_coords.min(axis=0), world_coords.max(axis=0))
+        mesh_entries[matrix_key] = bounds
+    
+    if transform is None:
+        _object_bounds_keys[obj.as_pointer()] = (mesh_key, matrix_key)
+    return bounds
+
+def invalidate_bounds_cache(mesh=None):
+    """Forget cached bounds of one mesh datablock, or of all meshes"""
+    if mesh is None:
+        _bounds_cache.clear()
+        _object_bounds_keys.clear()
+        _hull_points_cache.clear()
+    else:
+        _bounds_cache.pop(mesh.as_pointer(), None)
+        _hull_points_cache.pop(mesh.as_pointer(), None)
+
+def get_world_bounds(mesh_objects, transform=None):
+    """Get world-space bounds of mesh objects as (min_x, min_y, min_z, max_x, max_y, max_z)
+    
+    If transform is given, the bounds are measured after applying it on top of
+    each object's world matrix.
+    """
+    bbox_min = np.full(3, np.inf)
+    bbox_max = np.full(3, -np.inf)
+    
+    for obj in mesh_objects:
+        if len(obj.data.vertices) == 0:
+            continue
+        
+        obj_min, obj_max = _mesh_world_bounds(obj, transform)
+        bbox_min = np.minimum(bbox_min, obj_min)
+        bbox_max = np.maximum(bbox_max, obj_max)
+    
+    return (*bbox_min.tolist(), *bbox_max.tolist())
+
+def get_batch_world_bounds(vehicles, angles):
+    """Get the world bounds of many vehicles before and after a Z rotation each, in one sweep
+    
+    vehicles holds one list of mesh objects per vehicle, angles one rotation
+    about Z per vehicle. Only hull candidates are gathered, they hold the
+    extremes in every direction, and all vehicles are rotated and reduced
+    together. Returns two (vehicles, 6) arrays of
+    (min_x, min_y, min_z, max_x, max_y, max_z), unrotated and rotated.
+    """
+    chunks = []
+    counts = []
+    for mesh_objects in vehicles:
+        count = 0
+        for obj in mesh_objects:
+            if len(obj.data.vertices) == 0:
+                continue
+            if obj.data.users > 1:
+                local_points = _mesh_hull_points(obj.data)
+            else:
+                local_points = hull_candidates(_mesh_local_coords(obj.data))
+            chunks.append(_transform_coords(local_points, obj.matrix_world))
+            count += len(chunks[-1])
+        counts.append(count)
+    
+    points = np.concatenate(chunks)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    
+    # Per-point rotation, the same as Matrix.Rotation(angle, 4, 'Z') of its vehicle
+    cos = np.repeat(np.cos(angles), counts)
+    sin = np.repeat(np.sin(angles), counts)
+    rotated = np.column_stack([cos * points[:, 0] - sin * points[:, 1],
+                               sin * points[:, 0] + cos * points[:, 1],
+                               points[:, 2]])
+    
+    return tuple(np.hstack([np.minimum.reduceat(coords, starts), np.maximum.reduceat(coords, starts)])
+                 for coords in (points, rotated))
+
+def _bound_box_extents(obj):
+    """Get outer and inner world extents of an object's transformed bound_box"""
+    corners = np.array(obj.bound_box, dtype=np.float64)
+    world_corners = _transform_coords(corners, obj.matrix_world)
+    outer_min = world_corners.min(axis=0)
+    outer_max = world_corners.max(axis=0)
+    
+    # The mesh touches every face of its local box, so the true world extents
+    # reach at least as far as the nearest corner of each face
+    inner_min = np.full(3, np.inf)
+    inner_max = np.full(3, -np.inf)
+    for axis in range(3):
+        for side in (corners[:, axis].min(), corners[:, axis].max()):
+            face_corners = world_corners[corners[:, axis] == side]
+            inner_min = np.minimum(inner_min, face_corners.max(axis=0))
+            inner_max = np.maximum(inner_max, face_corners.min(axis=0))
+    
+    return outer_min, outer_max, inner_min, inner_max
+
+def get_fast_world_bounds(mesh_objects):
+    """Get world bounds without a vertex scan, as (bounds, slack)
+    
+    Uses cached exact bounds or hull points where available and the 8 bound_box
+    corners otherwise. The bounds never undershoot the exact bounds; slack is the
+    largest distance in meters that any side may overshoot.
+    """
+    outer_min = np.full(3, np.inf)
+    outer_max = np.full(3, -np.inf)
+    inner_min = np.full(3, np.inf)
+    inner_max = np.full(3, -np.inf)
+    
+    for obj in mesh_objects:
+        if len(obj.data.vertices) == 0:
+            continue
+        
+        mesh_key = obj.data.as_pointer()
+        exact = _bounds_cache.get(mesh_key, {}).get(_matrix_key(obj.matrix_world))
+        
+        if exact is None and mesh_key in _hull_points_cache:
+            exact = _mesh_world_bounds(obj)
+        
+        if exact is not None:
+            obj_min, obj_max = exact
+            obj_inner_min, obj_inner_max = exact
+        else:
+            obj_min, obj_max, obj_inner_min, obj_inner_max = _bound_box_extents(obj)
+        
+        outer_min = np.minimum(outer_min, obj_min)
+        outer_max = np.maximum(outer_max, obj_max)
+        inner_min = np.minimum(inner_min, obj_inner_min)
+        inner_max = np.maximum(inner_max, obj_inner_max)
+    
+    if not np.all(np.isfinite(outer_min)):
+        return (*outer_min.tolist(), *outer_max.tolist()), 0.0
+    
+    slack = max(float(np.max(inner_min - outer_min)), float(np.max(outer_max - inner_max)), 0.0)
+    return (*outer_min.tolist(), *outer_max.tolist()), slack
+
+def _fast_bounds_note(slack):
+    """Report suffix describing how tight fast bounds are"""
+    if slack < 0.001:
+        return ""
+    return f" (fast bounds, sides within {slack:.3f}m)"
+
+def _sample_world_coords(mesh_objects, max_points):
+    """Get world coordinates of all mesh vertices, evenly subsampled to about max_points"""
+    total = sum(len(obj.data.vertices) for obj in mesh_objects)
+    step = max(1, math.ceil(total / max(1, max_points)))
+    
+    samples = []
+    for obj in mesh_objects:
+        if len(obj.data.vertices) == 0:
+            continue
+        local_coords = _mesh_local_coords(obj.data)[::step]
+        samples.append(_transform_coords(local_coords, obj.matrix_world))
+    
+    if not samples:
+        return np.empty((0, 3))
+    return np.concatenate(samples)
+
+def compute_oriented_bounds(points):
+    """Fit an oriented bounding box to points with PCA, returns (center, axes, extents)
+    
+    axes holds one unit axis per row, sorted from largest to smallest variance.
+    """
+    mean = points.mean(axis=0)
+    centered = points - mean
+    eigvals, eigvecs = np.linalg.eigh(np.cov(centered.T))
+    axes = eigvecs[:, ::-1].T
+    
+    local = centered @ axes.T
+    local_min = local.min(axis=0)
+    local_max = local.max(axis=0)
+    center = mean + ((local_min + local_max) / 2) @ axes
+    
+    return center, axes, local_max - local_min
+
+def _footprint_area(xy, angle):
+    """Area of the rectangle around 2D points with one side at angle"""
+    axis = np.array([math.cos(angle), math.sin(angle)])
+    return np.ptp(xy @ axis) * np.ptp(xy @ np.array([-axis[1], axis[0]]))
+
+def _refine_length_angle(xy, angle):
+    """Turn a principal axis angle to the tightest footprint nearby, snapped to a world axis when close
+    
+    Side-mounted boxes and sampling noise tilt the principal axes, while the
+    footprint of the body stays tightest along the true length axis.
+    """
+    for span, step in ((ORIENT_REFINE_RANGE, ORIENT_REFINE_STEP),
+                       (ORIENT_REFINE_STEP, ORIENT_REFINE_FINE_STEP)):
+        candidates = angle + np.arange(-span, span + step / 2, step)
+        angle = candidates[np.argmin([_footprint_area(xy, candidate) for candidate in candidates])]
+    
+    # Only a vehicle clearly off-axis gets a free rotation
+    world_angle = round(angle / (math.pi / 2)) * (math.pi / 2)
+    if abs(angle - world_angle) < ORIENT_SNAP_ANGLE:
+        return world_angle
+    return angle
+
+def detect_vehicle_heading(points):
+    """Detect which way a vehicle faces from sampled world points
+    
+    Returns (angle, confidence): the rotation about Z that turns the front of
+    the vehicle towards +Y, and how sure the front/back choice is (0-1).
+    """
+    # Longest of the two horizontal principal axes is the length axis
+    xy = points[:, :2] - points[:, :2].mean(axis=0)
+    eigvals, eigvecs = np.linalg.eigh(np.cov(xy.T))
+    extents = [np.ptp(xy @ eigvecs[:, i]) for i in range(2)]
+    length_axis = eigvecs[:, int(np.argmax(extents))]
+    
+    length_angle = _refine_length_angle(xy, math.atan2(length_axis[1], length_axis[0]))
+    length_axis = np.array([math.cos(length_angle), math.sin(length_angle)])
+    
+    # Position along the length axis, -1 at one end and +1 at the other
+    along = xy @ length_axis
+    along = (along - (along.max() + along.min()) / 2) / max(np.ptp(along) / 2, 1e-9)
+    
+    # Mass distribution: engine bay, cab and dashboard put more geometry up front
+    mass_score = along.mean()
+    
+    # Wheel height: the lowest band (tyres, axles) sits behind the longer front overhang
+    heights = points[:, 2]
+    low_band = heights <= heights.min() + np.ptp(heights) * 0.15
+    wheel_score = -along[low_band].mean() if np.any(low_band) else 0.0
+    
+    score = mass_score + wheel_score
+    if abs(score) < 0.02:
+        # Heuristics disagree, keep the direction closest to the current +Y
+        score = length_axis[1]
+    if score < 0:
+        length_axis = -length_axis
+    
+    angle = math.pi / 2 - math.atan2(length_axis[1], length_axis[0])
+    angle = math.atan2(math.sin(angle), math.cos(angle))
+    
+    # Heuristics pointing opposite ways leave the front a guess
+    if mass_score * wheel_score < 0:
+        return angle, 0.0
+    return angle, min(1.0, abs(mass_score + wheel_score) / ORIENT_CONFIDENT_SCORE)
+
+def compute_vehicle_heading(mesh_objects, forward_axis):
+    """Get (angle, confidence) of the Z rotation that makes a vehicle face +Y
+    
+    confidence is None for an explicit forward axis. Returns None when the
+    meshes have no vertices to detect the heading from.
+    """
+    if forward_axis != 'AUTO':
+        return FORWARD_AXIS_ANGLES[forward_axis], None
+    
+    points = _sample_world_coords(mesh_objects, ORIENT_SAMPLE_LIMIT)
+    if len(points) < 3:
+        return None
+    return detect_vehicle_heading(points)
+
+def _hierarchy_depth(obj):
+    """Number of parents above an object"""
+    depth = 0
+    while obj.parent is not None:
+        obj = obj.parent
+        depth += 1
+    return depth
+
+def _transform_mesh(mesh, matrix):
+    """Bake a matrix into mesh data, keeping faces pointing outward when mirrored"""
+    mesh.transform(matrix, shape_keys=True)
+    
+    if matrix.determinant() < 0:
+        if hasattr(mesh, "flip_normals"):
+            mesh.flip_normals()
+        else:
+            bm = bmesh.new()
+            bm.from_mesh(mesh)
+            bmesh.ops.reverse_faces(bm, faces=bm.faces)
+            bm.to_mesh(mesh)
+            bm.free()
+    
+    mesh.update()
+    invalidate_bounds_cache(mesh)
+
+def _carry_cached_bounds(obj, transform):
+    """Seed the bounds cache for an object about to get an axis-aligned transform
+    
+    Scaling and translating along the world axes maps an AABB exactly, so the
+    new bounds follow from the cached ones without a vertex scan.
+    """
+    mesh_entries = _bounds_cache.get(obj.data.as_pointer())
+    if not mesh_entries:
+        return
+    
+    bounds = mesh_entries.get(_matrix_key(obj.matrix_world))
+    if bounds is None:
+        return
+    
+    corners = _transform_coords(np.array(bounds), transform)
+    mesh_entries[_matrix_key(transform @ obj.matrix_world)] = (corners.min(axis=0), corners.max(axis=0))
+
+def apply_world_transform(objects, transform, deferred=False):
+    """Apply a world-space transform to objects and bake rotation and scale into their meshes
+    
+    Each unique mesh datablock is transformed once with Mesh.transform() and the
+    object matrices are then set in one batch, keeping only their location.
+    Linked duplicates keep sharing their mesh; instances whose rotation or scale
+    differs from the baked one keep the difference on the object. No operators,
+    mode switches or temporary objects are involved.
+    
+    With deferred=True only the object matrices change and the meshes are flagged
+    for bake_pending_transforms().
+    """
+    object_set = set(objects)
+    new_matrices = {obj: transform @ obj.matrix_world for obj in objects}
+    
+    # Children outside the set keep following their transformed parents
+    for obj in objects:
+        for child in obj.children:
+            if child not in object_set:
+                new_matrices[child] = transform @ child.matrix_world
+    
+    if deferred:
+        linear = np.array(transform.to_3x3())
+        if not np.any(linear - np.diag(np.diag(linear))):
+            for obj in objects:
+                if obj.type == 'MESH':
+                    _carry_cached_bounds(obj, transform)
+        
+        for obj in sorted(new_matrices, key=_hierarchy_depth):
+            obj.matrix_world = new_matrices[obj]
+        for obj in objects:
+            if obj.type == 'MESH':
+                obj.arvehicles_pending_bake = True
+        return
+    
+    mesh_users = {}
+    for obj in objects:
+        if obj.type == 'MESH':
+            mesh_users.setdefault(obj.data, []).append(obj)
+    
+    # Linked duplicates outside the set share the baked data too
+    outside_users = {}
+    if any(mesh.users > len(users) for mesh, users in mesh_users.items()):
+        for obj in bpy.data.objects:
+            if obj.type == 'MESH' and obj.data in mesh_users and obj not in object_set:
+                outside_users.setdefault(obj.data, []).append(obj)
+    
+    baked_objects = set()
+    for mesh, users in mesh_users.items():
+        # Bake the rotation/scale most users end up with, exactly once per mesh
+        linears = [new_matrices[obj].to_3x3().to_4x4() for obj in users]
+        linear_keys = [_matrix_key(linear) for linear in linears]
+        baked_key = max(linear_keys, key=linear_keys.count)
+        baked_linear = linears[linear_keys.index(baked_key)]
+        
+        if abs(baked_linear.determinant()) < 1e-12:
+            # Degenerate scale cannot be baked, leave these objects unbaked
+            continue
+        
+        _transform_mesh(mesh, baked_linear)
+        inverse = baked_linear.inverted()
+        
+        # Instances keep sharing the mesh; any other rotation/scale stays on
+        # the object as the residual relative to the baked one
+        for obj, linear_key in zip(users, linear_keys):
+            if linear_key == baked_key:
+                new_matrices[obj] = Matrix.Translation(new_matrices[obj].translation)
+            else:
+                new_matrices[obj] = new_matrices[obj] @ inverse
+            baked_objects.add(obj)
+        
+        # Users outside the set must not move, so they absorb the bake as well
+        for obj in outside_users.get(mesh, []):
+            new_matrices[obj] = obj.matrix_world @ inverse
+            for child in obj.children:
+                if child not in new_matrices:
+                    new_matrices[child] = child.matrix_world.copy()
+    
+    # Parents first, so children resolve against their parent's new matrix
+    for obj in sorted(new_matrices, key=_hierarchy_depth):
+        obj.matrix_world = new_matrices[obj]
+    
+    for obj in baked_objects:
+        obj.arvehicles_pending_bake = False
+
+def get_pending_bake_objects(objects):
+    """Get mesh objects whose transform was deferred and still needs baking"""
+    return [obj for obj in objects if obj.type == 'MESH' and obj.arvehicles_pending_bake]
+
+def bake_pending_transforms(objects):
+    """Bake deferred Orient/Scale transforms into mesh data, returns the number of objects baked"""
+    pending = get_pending_bake_objects(objects)
+    if pending:
+        # The transform is already on the objects, baking is an identity apply
+        apply_world_transform(pending, Matrix.Identity(4))
+    return len(pending)
+
+def _supporting_planes(points, tolerance):
+    """Get the facet planes of the hull of a handful of points as (normals, offsets)
+    
+    Brute force over all point triples, only meant for the few dozen extreme
+    points of the prefilter. Returns None when the points span no volume.
+    """
+    triples = np.array(list(itertools.combinations(range(len(points)), 3)))
+    if len(triples) == 0:
+        return None
+    
+    corner_a, corner_b, corner_c = points[triples[:, 0]], points[triples[:, 1]], points[triples[:, 2]]
+    normals = np.cross(corner_b - corner_a, corner_c - corner_a)
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > tolerance
+    normals = normals[valid] / lengths[valid][:, None]
+    offsets = np.einsum('ij,ij->i', normals, corner_a[valid])
+    
+    # A triangle spans a hull facet when every point lies on one side of its plane
+    side = points @ normals.T - offsets
+    below = np.all(side <= tolerance, axis=0)
+    above = np.all(side >= -tolerance, axis=0) & ~below
+    normals = np.concatenate((normals[below], -normals[above]))
+    offsets = np.concatenate((offsets[below], -offsets[above]))
+    if len(normals) < 4:
+        return None
+    
+    # Coplanar triangles give the same plane several times
+    plane_keys = np.column_stack((np.round(normals, 6), np.round(offsets / tolerance)))
+    _, unique = np.unique(plane_keys, axis=0, return_index=True)
+    return normals[unique], offsets[unique]
+
+def hull_candidates(points):
+    """Drop points that cannot lie on the convex hull of an (N, 3) array
+    
+    Akl-Toussaint culling: the extreme points along a fixed set of directions
+    span a polytope inside the hull, and every point strictly inside that
+    polytope is discarded. The hull of the result equals the hull of the input.
+    """
+    if len(points) <= HULL_PREFILTER_MIN_POINTS:
+        return points
+    
+    # Extreme point per direction, read chunk by chunk
+    best_values = np.full(len(HULL_PREFILTER_DIRECTIONS), -np.inf)
+    best_indices = np.zeros(len(HULL_PREFILTER_DIRECTIONS), dtype=np.int64)
+    for start in range(0, len(points), HULL_PREFILTER_CHUNK):
+        projections = points[start:start + HULL_PREFILTER_CHUNK] @ HULL_PREFILTER_DIRECTIONS.T
+        indices = np.argmax(projections, axis=0)
+        values = projections[indices, np.arange(len(HULL_PREFILTER_DIRECTIONS))]
+        better = values > best_values
+        best_values[better] = values[better]
+        best_indices[better] = indices[better] + start
+    
+    extent = float(np.max(points.max(axis=0) - points.min(axis=0)))
+    tolerance = max(extent, 1.0) * 1e-7
+    planes = _supporting_planes(points[np.unique(best_indices)], tolerance)
+    if planes is None:
+        return points
+    normals, offsets = planes
+    
+    # Keep everything on or outside the polytope
+    keep = np.empty(len(points), dtype=bool)
+    for start in range(0, len(points), HULL_PREFILTER_CHUNK):
+        chunk = points[start:start + HULL_PREFILTER_CHUNK]
+        keep[start:start + len(chunk)] = np.max(chunk @ normals.T - offsets, axis=1) > -tolerance
+    return points[keep]
+
+def stratified_hull_sample(points, max_points):
+    """Thin an (N, 3) array to at most max_points while keeping its outline
+    
+    Points are binned into a voxel grid and each occupied voxel keeps only its
+    extreme point along each sample direction, so thin parts such as mirrors
+    and antennas keep their tips. The grid is coarsened until the result fits.
+    """
+    if len(points) <= max_points:
+        return points
+    
+    lower = points.min(axis=0)
+    extent = max(float(np.max(points.max(axis=0) - lower)), 1e-9)
+    projections = points @ STRATIFIED_SAMPLE_DIRECTIONS.T
+    resolution = STRATIFIED_SAMPLE_RESOLUTION
+    
+    while True:
+        cells = np.minimum((points - lower) * (resolution / extent), resolution - 1).astype(np.int64)
+        voxels = (cells[:, 0] * resolution + cells[:, 1]) * resolution + cells[:, 2]
+        
+        # Number the occupied voxels through a table over the grid, no sorting
+        occupied = np.zeros(resolution ** 3, dtype=bool)
+        occupied[voxels] = True
+        voxel_ids = (np.cumsum(occupied) - 1)[voxels]
+        
+        keep = np.zeros(len(points), dtype=bool)
+        for column in range(len(STRATIFIED_SAMPLE_DIRECTIONS)):
+            best = np.full(np.count_nonzero(occupied), -np.inf)
+            np.maximum.at(best, voxel_ids, projections[:, column])
+            keep |= projections[:, column] == best[voxel_ids]
+        
+        # A single voxel keeps just the overall extremes
+        if np.count_nonzero(keep) <= max_points or resolution == 1:
+            return points[keep]
+        resolution //= 2
+
+def gather_hull_points(mesh_objects):
+    """Get the world-space hull candidates of the mesh objects as one (N, 3) array
+    
+    Each object is filtered on its own first (hull of hulls), shared meshes reuse
+    their cached hull vertices, then the combined set is filtered once more.
+    """
+    chunks = []
+    for obj in mesh_objects:
+        if len(obj.data.vertices) == 0:
+            continue
+        if obj.data.users > 1:
+            local_points = _mesh_hull_points(obj.data)
+        else:
+            local_points = hull_candidates(_mesh_local_coords(obj.data))
+        chunks.append(_transform_coords(local_points, obj.matrix_world))
+    
+    if not chunks:
+        return np.empty((0, 3))
+    return hull_candidates(np.concatenate(chunks))
+
+def build_convex_hull(points, mesh, merge_coplanar=False):
+    """Replace the geometry of mesh with the convex hull of an (N, 3) array of points
+    
+    Works on a free-standing BMesh, so no temporary objects, mode switches or
+    selection changes are needed. With merge_coplanar the hull triangles lying
+    in one plane become a single polygon. Returns the number of hull faces,
+    0 when the points span no volume.
+    """
+    # Fill the mesh straight from the NumPy buffer, BMesh then reads it in bulk
+    mesh.clear_geometry()
+    mesh.vertices.add(len(points))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(points, dtype=np.float32).ravel())
+    
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.convex_hull(bm, input=bm.verts)
+    
+    # Points inside the hull are left behind without faces
+    loose_verts = [vert for vert in bm.verts if not vert.link_faces]
+    bmesh.ops.delete(bm, geom=loose_verts, context='VERTS')
+    
+    if merge_coplanar:
+        bmesh.ops.dissolve_limit(bm, angle_limit=HULL_COPLANAR_ANGLE, verts=bm.verts[:], edges=bm.edges[:])
+    
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+    return len(mesh.polygons)
+
+def _mesh_triangles(mesh):
+    """Read the loop triangles of a mesh as an (N, 3) array of vertex indices"""
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    return triangles.reshape(-1, 3).astype(np.int64)
+
+def _hull_triangles(points):
+    """Get the convex hull of an (N, 3) array as rows of three point indices"""
+    bm = bmesh.new()
+    for co in points:
+        bm.verts.new(co)
+    bm.verts.index_update()
+    bmesh.ops.convex_hull(bm, input=bm.verts)
+    
+    triangles = [[vert.index for vert in face.verts[:3]] for face in bm.faces]
+    bm.free()
+    return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+def merge_hull_planes(points, triangles, max_planes):
+    """Merge neighbouring hull faces until at most max_planes planes remain
+    
+    Every group of faces is replaced by one plane along their area-weighted
+    normal, pushed out until it touches the hull, so the planes always enclose
+    the points. The merge adding the least volume (group area times the mean
+    gap between the faces and the new plane) goes first, ties are broken by
+    face index to keep the result deterministic. Returns (normals, offsets).
+    """
+    corner_a, corner_b, corner_c = points[triangles[:, 0]], points[triangles[:, 1]], points[triangles[:, 2]]
+    
+    # Area-weighted sums per group: normal, centroid and the gap error so far
+    group_normal = np.cross(corner_b - corner_a, corner_c - corner_a) / 2
+    group_area = np.linalg.norm(group_normal, axis=1)
+    group_center = (corner_a + corner_b + corner_c) / 3 * group_area[:, None]
+    group_error = np.zeros(len(triangles))
+    
+    # Hull vertices make the normals point outwards from the interior
+    interior = points[np.unique(triangles)].mean(axis=0)
+    inward = np.einsum('ij,ij->i', group_normal, corner_a - interior) < 0
+    group_normal[inward] *= -1
+    
+    # Faces sharing an edge are neighbours
+    edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    edge_faces = np.repeat(np.arange(len(triangles)), 3)
+    order = np.lexsort((edges[:, 1], edges[:, 0]))
+    edges, edge_faces = edges[order], edge_faces[order]
+    shared = np.all(edges[1:] == edges[:-1], axis=1)
+    adjacency = np.sort(np.column_stack((edge_faces[:-1][shared], edge_faces[1:][shared])), axis=1)
+    adjacency = np.unique(adjacency[adjacency[:, 0] != adjacency[:, 1]], axis=0)
+    
+    neighbours = [set() for _ in range(len(triangles))]
+    for first, second in adjacency.tolist():
+        neighbours[first].add(second)
+        neighbours[second].add(first)
+    
+    group_vertices = list(triangles)
+    group_points = [points[vertices] for vertices in group_vertices]
+    versions = [0] * len(triangles)
+    
+    def merge_error(first, second):
+        normal = group_normal[first] + group_normal[second]
+        length = math.sqrt(normal.dot(normal))
+        if length < 1e-12:
+            return None
+        normal /= length
+        support = max((group_points[first] @ normal).max(), (group_points[second] @ normal).max())
+        return (group_area[first] + group_area[second]) * support - normal.dot(group_center[first] + group_center[second])
+    
+    # Merging two single faces, costed for all neighbouring pairs at once
+    first, second = adjacency[:, 0], adjacency[:, 1]
+    pair_normals = group_normal[first] + group_normal[second]
+    lengths = np.linalg.norm(pair_normals, axis=1)
+    valid = lengths > 1e-12
+    first, second = first[valid], second[valid]
+    pair_normals = pair_normals[valid] / lengths[valid][:, None]
+    pair_points = points[np.concatenate((triangles[first], triangles[second]), axis=1)]
+    support = np.max(np.einsum('ijk,ik->ij', pair_points, pair_normals), axis=1)
+    errors = (group_area[first] + group_area[second]) * support - np.einsum(
+        'ij,ij->i', pair_normals, group_center[first] + group_center[second])
+    
+    # Heap entries: (added error, group, group, versions when costed, merged error)
+    heap = [(error, a, b, 0, 0, error) for error, a, b in zip(errors.tolist(), first.tolist(), second.tolist())]
+    heapq.heapify(heap)
+    
+    remaining = len(triangles)
+    while remaining > max_planes and heap:
+        _, first, second, first_version, second_version, error = heapq.heappop(heap)
+        # Skip entries costed before one of the groups changed
+        if versions[first] != first_version or versions[second] != second_version:
+            continue
+        
+        group_area[first] += group_area[second]
+        group_normal[first] += group_normal[second]
+        group_center[first] += group_center[second]
+        group_error[first] = error
+        group_vertices[first] = np.union1d(group_vertices[first], group_vertices[second])
+        group_points[first] = points[group_vertices[first]]
+        versions[first] += 1
+        versions[second] = -1
+        remaining -= 1
+        
+        for other in neighbours[second]:
+            neighbours[other].discard(second)
+            if other != first:
+                neighbours[other].add(first)
+                neighbours[first].add(other)
+        neighbours[first].discard(second)
+        
+        for other in sorted(neighbours[first]):
+            low, high = min(first, other), max(first, other)
+            merged_error = merge_error(low, high)
+            if merged_error is not None:
+                heapq.heappush(heap, (merged_error - group_error[low] - group_error[high], low, high,
+                                      versions[low], versions[high], merged_error))
+    
+    kept = [index for index, version in enumerate(versions) if version >= 0]
+    normals = group_normal[kept] / np.linalg.norm(group_normal[kept], axis=1)[:, None]
+    offsets = np.max(points @ normals.T, axis=0)
+    return normals, offsets
+
+def build_hull_from_planes(normals, offsets, interior, mesh):
+    """Replace the geometry of mesh with the region where normals . x <= offsets
+    
+    The corners come from the dual hull: seen from an interior point each plane
+    maps to normal / distance, and every face of the hull of those points maps
+    back to one corner. Returns the number of faces, 0 when the planes do not
+    enclose a bounded volume around interior (the mesh is left unchanged).
+    """
+    distances = offsets - normals @ interior
+    if np.any(distances <= 0):
+        return 0
+    
+    dual_points = normals / distances[:, None]
+    triangles = _hull_triangles(dual_points)
+    if len(triangles) == 0:
+        return 0
+    
+    corner_a, corner_b, corner_c = dual_points[triangles[:, 0]], dual_points[triangles[:, 1]], dual_points[triangles[:, 2]]
+    face_normals = np.cross(corner_b - corner_a, corner_c - corner_a)
+    lengths = np.linalg.norm(face_normals, axis=1)
+    radius = np.max(np.linalg.norm(dual_points, axis=1))
+    valid = lengths > 1e-12 * radius * radius
+    face_normals = face_normals[valid] / lengths[valid][:, None]
+    heights = np.einsum('ij,ij->i', face_normals, corner_a[valid])
+    
+    # A dual face through the origin would put its corner at infinity
+    if np.any(np.abs(heights) <= 1e-9 * radius):
+        return 0
+    
+    corners = interior + face_normals / heights[:, None]
+    # Corners where more than three planes meet show up once per dual triangle
+    _, unique = np.unique(np.round(corners, 6), axis=0, return_index=True)
+    return build_convex_hull(corners[np.sort(unique)], mesh, merge_coplanar=True)
+
+def _mesh_face_planes(mesh, interior):
+    """Get the planes of the faces of a convex mesh as (normals, offsets), one per distinct plane"""
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    centers = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    mesh.polygons.foreach_get("center", centers)
+    normals = normals.reshape(-1, 3).astype(np.float64)
+    centers = centers.reshape(-1, 3).astype(np.float64)
+    normals /= np.linalg.norm(normals, axis=1)[:, None]
+    
+    # Face the normals away from the interior whatever the winding
+    inward = np.einsum('ij,ij->i', normals, centers - interior) < 0
+    normals[inward] *= -1
+    offsets = np.einsum('ij,ij->i', normals, centers)
+    
+    # Coplanar triangles of an unsimplified hull share one plane
+    _, unique = np.unique(np.round(np.column_stack((normals, offsets)), 6), axis=0, return_index=True)
+    unique = np.sort(unique)
+    return normals[unique], offsets[unique]
+
+def simplify_convex_hull(mesh, max_faces, padding=0.0):
+    """Reduce a convex hull mesh to at most max_faces faces and pad it, keeping it convex
+    
+    Padding pushes every plane outward by the given distance before the planes
+    are intersected again, so the face count stays the same. Returns the new
+    face count, 0 when the hull could not be rebuilt (the mesh is left unchanged).
+    """
+    points = _mesh_local_coords(mesh)
+    interior = points.mean(axis=0)
+    
+    if len(mesh.polygons) > max_faces:
+        normals, offsets = merge_hull_planes(points, _mesh_triangles(mesh), max_faces)
+    else:
+        normals, offsets = _mesh_face_planes(mesh, interior)
+    
+    return build_hull_from_planes(normals, offsets + padding, interior, mesh)
+
+def bounding_box_corners(mesh_objects, oriented=False, padding=0.0):
+    """Get the 8 world-space corners of the bounding box of mesh objects
+    
+    With oriented the box follows the principal axes of the vertices (PCA) and
+    is then fitted exactly to all vertices. Padding grows every side.
+    """
+    rotation = np.identity(3)
+    transform = None
+    points = _sample_world_coords(mesh_objects, ORIENT_SAMPLE_LIMIT) if oriented else None
+    if oriented and len(points) >= 3:
+        _, rotation, _ = compute_oriented_bounds(points)
+        # Keep a right-handed frame so the box is not mirrored
+        if np.linalg.det(rotation) < 0:
+            rotation[2] *= -1
+        transform = Matrix(rotation.tolist()).to_4x4()
+    
+    bounds = np.array(get_world_bounds(mesh_objects, transform))
+    box_min = bounds[:3] - padding
+    box_max = bounds[3:] + padding
+    corners = np.array(list(itertools.product(*zip(box_min, box_max))))
+    return corners @ rotation
+
+def sample_mesh_surface(mesh_objects, spacing, seed=0):
+    """Get world-space points covering the mesh surfaces roughly spacing apart
+    
+    Every vertex is kept, and triangles larger than spacing squared get extra
+    random points in proportion to their area. A fixed seed keeps it repeatable.
+    """
+    rng = np.random.default_rng(seed)
+    chunks = []
+    
+    for obj in mesh_objects:
+        if len(obj.data.vertices) == 0:
+            continue
+        coords = _transform_coords(_mesh_local_coords(obj.data), obj.matrix_world)
+        chunks.append(coords)
+        
+        triangles = _mesh_triangles(obj.data)
+        corner_a = coords[triangles[:, 0]]
+        edge_b = coords[triangles[:, 1]] - corner_a
+        edge_c = coords[triangles[:, 2]] - corner_a
+        areas = np.linalg.norm(np.cross(edge_b, edge_c), axis=1) / 2
+        counts = np.floor(areas / (spacing * spacing)).astype(np.int64)
+        if counts.sum() == 0:
+            continue
+        
+        # Uniform points on each triangle, folding samples that land past the diagonal
+        owners = np.repeat(np.arange(len(triangles)), counts)
+        u, v = rng.random((2, len(owners)))
+        folded = u + v > 1
+        u[folded], v[folded] = 1 - u[folded], 1 - v[folded]
+        chunks.append(corner_a[owners] + u[:, None] * edge_b[owners] + v[:, None] * edge_c[owners])
+    
+    if not chunks:
+        return np.empty((0, 3))
+    return np.concatenate(chunks)
+
+def sample_surface_points(mesh_objects, count, seed=0):
+    """Draw count world-space points spread over the mesh surfaces by area
+    
+    The cost depends on count rather than the vertex count, so million-vertex
+    meshes can be compared quickly. A fixed seed keeps it repeatable.
+    """
+    corners = []
+    edges_b = []
+    edges_c = []
+    
+    for obj in mesh_objects:
+        if len(obj.data.polygons) == 0:
+            continue
+        coords = _transform_coords(_mesh_local_coords(obj.data), obj.matrix_world)
+        triangles = _mesh_triangles(obj.data)
+        corners.append(coords[triangles[:, 0]])
+        edges_b.append(coords[triangles[:, 1]] - corners[-1])
+        edges_c.append(coords[triangles[:, 2]] - corners[-1])
+    
+    if not corners:
+        return np.empty((0, 3))
+    corner_a = np.concatenate(corners)
+    edge_b = np.concatenate(edges_b)
+    edge_c = np.concatenate(edges_c)
+    areas = np.linalg.norm(np.cross(edge_b, edge_c), axis=1)
+    if areas.sum() == 0:
+        return np.empty((0, 3))
+    
+    # Pick triangles by area, then a uniform point on each
+    rng = np.random.default_rng(seed)
+    owners = rng.choice(len(areas), size=count, p=areas / areas.sum())
+    u, v = rng.random((2, count))
+    folded = u + v > 1
+    u[folded], v[folded] = 1 - u[folded], 1 - v[folded]
+    return corner_a[owners] + u[:, None] * edge_b[owners] + v[:, None] * edge_c[owners]
+
+def surface_distances(points, mesh_objects):
+    """Get the distance from each point to the nearest surface of the meshes"""
+    coords = []
+    triangles = []
+    offset = 0
+    for obj in mesh_objects:
+        if len(obj.data.polygons) == 0:
+            continue
+        coords.append(_transform_coords(_mesh_local_coords(obj.data), obj.matrix_world))
+        triangles.append(_mesh_triangles(obj.data) + offset)
+        offset += len(coords[-1])
+    
+    if not coords:
+        return np.full(len(points), np.inf)
+    tree = BVHTree.FromPolygons(np.concatenate(coords).tolist(), np.concatenate(triangles).tolist())
+    
+    distances = np.empty(len(points))
+    for index, co in enumerate(points.tolist()):
+        distances[index] = tree.find_nearest(co)[3]
+    return distances
+
+def _dilate_grid(grid):
+    """Grow a boolean voxel grid by one cell along the six axis directions"""
+    grown = grid.copy()
+    grown[1:] |= grid[:-1]
+    grown[:-1] |= grid[1:]
+    grown[:, 1:] |= grid[:, :-1]
+    grown[:, :-1] |= grid[:, 1:]
+    grown[:, :, 1:] |= grid[:, :, :-1]
+    grown[:, :, :-1] |= grid[:, :, 1:]
+    return grown
+
+def _voxelize_solid(points, resolution):
+    """Voxelize the volume enclosed by surface points
+    
+    Returns (solid grid, surface grid, origin, voxel size). The longest side of
+    the points gets resolution voxels.
+    """
+    bbox_min = points.min(axis=0)
+    extent = points.max(axis=0) - bbox_min
+    voxel_size = max(float(extent.max()), 1e-6) / resolution
+    
+    # Two empty layers around the shape keep the outside connected for the flood fill,
+    # the extra half voxel keeps points on the bounds clear of rounding at cell borders
+    origin = bbox_min - 2.5 * voxel_size
+    shape = tuple(np.floor(extent / voxel_size + 2.5).astype(np.int64) + 3)
+    indices = np.floor((points - origin) / voxel_size).astype(np.int64)
+    surface = np.zeros(shape, dtype=bool)
+    surface[tuple(indices.T)] = True
+    
+    # Close one-voxel gaps so seams and small holes do not let the outside leak in
+    closed = _dilate_grid(surface)
+    
+    # Flood fill the outside from the border
+    outside = np.zeros(shape, dtype=bool)
+    outside[[0, -1], :, :] = True
+    outside[:, [0, -1], :] = True
+    outside[:, :, [0, -1]] = True
+    while True:
+        grown = _dilate_grid(outside) & ~closed
+        if np.array_equal(grown, outside):
+            break
+        outside = grown
+    
+    # Taking the outside back in by one voxel undoes the gap closing
+    solid = ~_dilate_grid(outside) | surface
+    return solid, surface, origin, voxel_size
+
+def _directional_hull_excess(cells):
+    """Count the voxels inside the 26-direction hull of a set of cells that the cells do not fill"""
+    lowest, highest = cells.min(axis=0), cells.max(axis=0)
+    box_cells = np.indices(highest - lowest + 1).reshape(3, -1).T + lowest
+    support = (cells @ HULL_PREFILTER_DIRECTIONS.T).max(axis=0)
+    inside = np.all(box_cells @ HULL_PREFILTER_DIRECTIONS.T <= support + 1e-6, axis=1)
+    return int(np.count_nonzero(inside)) - len(cells)
+
+def _best_split(cells, executor):
+    """Split cells with the axis plane that leaves the least concavity, None if they cannot be split"""
+    candidates = []
+    for axis in range(3):
+        lowest, highest = int(cells[:, axis].min()), int(cells[:, axis].max())
+        step = max(1, (highest - lowest) // DECOMPOSE_SPLITS_PER_AXIS)
+        candidates.extend((axis, position) for position in range(lowest + 1, highest + 1, step))
+    
+    if not candidates:
+        return None
+    
+    def split_excess(candidate):
+        axis, position = candidate
+        below = cells[:, axis] < position
+        return _directional_hull_excess(cells[below]) + _directional_hull_excess(cells[~below])
+    
+    # Candidates are scored in parallel, the first best one wins so the result is repeatable
+    scores = list(executor.map(split_excess, candidates))
+    axis, position = candidates[int(np.argmin(scores))]
+    below = cells[:, axis] < position
+    return cells[below], cells[~below]
+
+def decompose_convex_parts(points, resolution, max_parts, max_concavity):
+    """Split the shape enclosed by surface points into nearly convex parts
+    
+    The enclosed volume is voxelized, then the most concave part is cut by the
+    best axis plane until every part is within max_concavity (hull voxels not
+    filled, as a fraction of the whole volume) or max_parts is reached, and
+    parts whose union stays within max_concavity are joined again. Candidates
+    are scored on a thread pool, NumPy releases the GIL while it works.
+    Returns one world-space point array per part, largest part first.
+    """
+    solid, surface, origin, voxel_size = _voxelize_solid(points, resolution)
+    cells = np.argwhere(solid)
+    total = len(cells)
+    
+    parts = [cells]
+    concavities = [_directional_hull_excess(cells) / total]
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for _ in range(DECOMPOSE_ROUNDS):
+            while len(parts) < max_parts:
+                worst = int(np.argmax(concavities))
+                if concavities[worst] <= max_concavity:
+                    break
+                
+                split = _best_split(parts[worst], executor)
+                if split is None:
+                    break
+                
+                parts[worst] = split[0]
+                parts.append(split[1])
+                concavities[worst] = _directional_hull_excess(split[0]) / total
+                concavities.append(_directional_hull_excess(split[1]) / total)
+            
+            # Axis cuts can slice convex pieces apart, join parts back while the union stays convex enough
+            merged = False
+            while len(parts) > 1:
+                pairs = list(itertools.combinations(range(len(parts)), 2))
+                pair_concavities = list(executor.map(
+                    lambda pair: _directional_hull_excess(np.concatenate((parts[pair[0]], parts[pair[1]]))) / total,
+                    pairs))
+                best = int(np.argmin(pair_concavities))
+                if pair_concavities[best] > max_concavity:
+                    break
+                
+                first, second = pairs[best]
+                parts[first] = np.concatenate((parts[first], parts[second]))
+                concavities[first] = pair_concavities[best]
+                del parts[second], concavities[second]
+                merged = True
+            
+            # Merging frees parts for further splits, stop once nothing changes
+            if not merged or all(concavity <= max_concavity for concavity in concavities):
+                break
+    
+    parts.sort(key=len, reverse=True)
+    labels = np.full(solid.shape, -1, dtype=np.int64)
+    for index, part_cells in enumerate(parts):
+        labels[tuple(part_cells.T)] = index
+    
+    # Each part keeps its own surface points plus the centers of its interior voxels
+    point_labels = labels[tuple(np.floor((points - origin) / voxel_size).astype(np.int64).T)]
+    part_points = []
+    for index, part_cells in enumerate(parts):
+        interior = part_cells[~surface[tuple(part_cells.T)]]
+        part_points.append(np.concatenate((points[point_labels == index],
+                                           origin + (interior + 0.5) * voxel_size)))
+    return part_points
+
+def split_face_budget(weights, budget, minimum, caps=None):
+    """Share a face budget out in proportion to weights, every share at least minimum
+    
+    With caps, no share goes over its cap (the faces a part can use at all),
+    and what capped parts leave over is filled into the others.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    caps = np.full(len(weights), np.inf) if caps is None else np.asarray(caps, dtype=np.float64)
+    shares = np.minimum(minimum, caps)
+    spare = max(0.0, budget - shares.sum())
+    filling = shares < caps
+    
+    # Water filling: split the spare faces by weight, pin parts that overflow and split again
+    while spare > 0 and filling.any():
+        open_weights = np.where(filling, weights, 0.0)
+        if open_weights.sum() == 0:
+            open_weights = filling.astype(np.float64)
+        proposal = shares + open_weights / open_weights.sum() * spare
+        overflow = filling & (proposal >= caps)
+        if not overflow.any():
+            shares = proposal
+            break
+        spare -= float((caps[overflow] - shares[overflow]).sum())
+        shares[overflow] = caps[overflow]
+        filling &= ~overflow
+    
+    counts = np.floor(shares).astype(np.int64)
+    
+    # Faces lost to rounding go to the largest remainders
+    leftover = int(round(shares.sum())) - int(counts.sum())
+    counts[np.argsort(counts - shares, kind='stable')[:max(0, leftover)]] += 1
+    return counts
+
+def _connected_components(vertex_count, edges):
+    """Label the connected pieces of a mesh, returns one label per vertex
+    
+    Hooks the root of every edge end to the smaller root and flattens the
+    label chains by pointer jumping until nothing changes, all vectorized.
+    """
+    labels = np.arange(vertex_count)
+    while True:
+        roots_a, roots_b = labels[edges[:, 0]], labels[edges[:, 1]]
+        lowest = np.minimum(roots_a, roots_b)
+        hooked = labels.copy()
+        np.minimum.at(hooked, roots_a, lowest)
+        np.minimum.at(hooked, roots_b, lowest)
+        
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+def _frame_bounds(frames, points):
+    """Get (mins, maxs) of points in each of a stack of (F, 3, 3) row-axis frames"""
+    local = np.einsum('fij,nj->fni', frames, points)
+    return local.min(axis=1), local.max(axis=1)
+
+def fit_oriented_box(points):
+    """Fit a close to minimum-volume oriented box to points, returns (center, axes, extents)
+    
+    Starts from the better of the world and PCA frames, then tries rotations
+    about each box axis over a shrinking range, all candidate frames of a pass
+    measured in one vectorized step.
+    """
+    _, pca_axes, _ = compute_oriented_bounds(points)
+    frames = np.array([np.identity(3), pca_axes])
+    span = math.pi / 4
+    
+    for _ in range(PRIMITIVE_BOX_PASSES):
+        frame_min, frame_max = _frame_bounds(frames, points)
+        frame = frames[int(np.argmin(np.prod(frame_max - frame_min, axis=1)))]
+        
+        candidates = [frame]
+        for angle in np.linspace(-span, span, PRIMITIVE_BOX_ANGLES):
+            cos, sin = math.cos(angle), math.sin(angle)
+            for first, second in ((1, 2), (2, 0), (0, 1)):
+                turn = np.identity(3)
+                turn[first, first] = turn[second, second] = cos
+                turn[first, second], turn[second, first] = -sin, sin
+                candidates.append(turn @ frame)
+        frames = np.array(candidates)
+        span *= 2 / PRIMITIVE_BOX_ANGLES
+    
+    frame_min, frame_max = _frame_bounds(frames, points)
+    best = int(np.argmin(np.prod(frame_max - frame_min, axis=1)))
+    center = ((frame_min[best] + frame_max[best]) / 2) @ frames[best]
+    return center, frames[best], frame_max[best] - frame_min[best]
+
+def fit_cylinder(points, center, axes):
+    """Fit a cylinder along the best of the box axes, returns (volume, center, axis index, radius, length)"""
+    best = None
+    for index in range(3):
+        axis = axes[index]
+        along = (points - center) @ axis
+        radius = float(np.linalg.norm((points - center) - along[:, None] * axis, axis=1).max())
+        length = float(along.max() - along.min())
+        volume = math.pi * radius * radius * length
+        if best is None or volume < best[0]:
+            best = (volume, center + (along.max() + along.min()) / 2 * axis, index, radius, length)
+    return best
+
+def fit_capsule(points, center, axes, index):
+    """Fit a capsule along box axis index, returns (volume, center, radius, length between the caps)"""
+    axis = axes[index]
+    along = (points - center) @ axis
+    distances = np.linalg.norm((points - center) - along[:, None] * axis, axis=1)
+    radius = float(distances.max())
+    
+    # Every point must fall inside a cap, which limits how short the middle can be
+    reach = np.sqrt(np.maximum(radius * radius - distances * distances, 0.0))
+    start, end = float((along + reach).min()), float((along - reach).max())
+    if end < start:
+        start = end = (start + end) / 2
+    
+    volume = math.pi * radius * radius * (end - start) + 4 / 3 * math.pi * radius ** 3
+    return volume, center + (start + end) / 2 * axis, radius, end - start
+
+def _ring_points(center, first, second, radius):
+    """Get PRIMITIVE_SEGMENTS points on a circle spanned by two unit axes"""
+    angles = np.arange(PRIMITIVE_SEGMENTS) * (2 * math.pi / PRIMITIVE_SEGMENTS)
+    return center + radius * (np.cos(angles)[:, None] * first + np.sin(angles)[:, None] * second)
+
+def fit_primitive(points, primitive, padding=0.0):
+    """Fit a box, cylinder or capsule to points, returns (kind, collider vertices)
+    
+    primitive 'AUTO' picks whichever kind encloses the points with the least
+    volume. The vertices are polygons circumscribing the exact shape, grown by
+    padding, ready to be hulled.
+    """
+    points = hull_candidates(points)
+    center, axes, extents = fit_oriented_box(points)
+    
+    fits = {'BOX': (float(np.prod(extents)),)}
+    if primitive in ('AUTO', 'CYLINDER', 'CAPSULE'):
+        fits['CYLINDER'] = fit_cylinder(points, center, axes)
+    if primitive in ('AUTO', 'CAPSULE'):
+        fits['CAPSULE'] = fit_capsule(points, center, axes, int(np.argmax(extents)))
+    
+    kind = primitive if primitive != 'AUTO' else min(fits, key=lambda name: fits[name][0])
+    
+    # Polygons inside a circle lose some area, scale them out to circumscribe it
+    circumscribe = 1 / math.cos(math.pi / PRIMITIVE_SEGMENTS)
+    
+    if kind == 'BOX':
+        half = extents / 2 + padding
+        corners = np.array(list(itertools.product(*zip(-half, half))))
+        return kind, center + corners @ axes
+    
+    if kind == 'CYLINDER':
+        _, cylinder_center, index, radius, length = fits['CYLINDER']
+        axis, first, second = axes[index], axes[(index + 1) % 3], axes[(index + 2) % 3]
+        radius = (radius + padding) * circumscribe
+        half = length / 2 + padding
+        return kind, np.concatenate([_ring_points(cylinder_center + side * half * axis, first, second, radius)
+                                     for side in (-1, 1)])
+    
+    _, capsule_center, radius, length = fits['CAPSULE']
+    index = int(np.argmax(extents))
+    axis, first, second = axes[index], axes[(index + 1) % 3], axes[(index + 2) % 3]
+    latitudes = np.linspace(0, math.pi / 2, PRIMITIVE_SEGMENTS // 4, endpoint=False)
+    radius = (radius + padding) * circumscribe / math.cos(math.pi / PRIMITIVE_SEGMENTS)
+    rings = [capsule_center + side * (length / 2 + radius) * axis for side in (-1, 1)]
+    for latitude in latitudes:
+        for side in (-1, 1):
+            ring_center = capsule_center + side * (length / 2 + radius * math.sin(latitude)) * axis
+            rings.append(_ring_points(ring_center, first, second, radius * math.cos(latitude)))
+    return kind, np.vstack(rings)
+
+def _mesh_buffer_digest(mesh):
+    """Start a hash of the vertex positions and face layout of a mesh, read with foreach_get"""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.vertices.foreach_get("co", coords)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for buffer in (coords, loop_vertices, loop_totals):
+        digest.update(buffer.tobytes())
+    return digest
+
+def source_fingerprint(obj):
+    """Fingerprint of a mesh object's geometry and world transform as a hex string"""
+    digest = _mesh_buffer_digest(obj.data)
+    digest.update(np.array(obj.matrix_world, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+def collider_cache_key(generator, mesh_objects, params):
+    """Content address of a collider set: generator, source fingerprints and parameters
+    
+    Fingerprints are sorted, so the key does not depend on selection order.
+    """
+    digest = hashlib.blake2b(generator.encode(), digest_size=16)
+    for fingerprint in sorted(source_fingerprint(obj) for obj in mesh_objects):
+        digest.update(fingerprint.encode())
+    digest.update(repr(params).encode())
+    return digest.hexdigest()
+
+def store_collider_meshes(key, named_meshes):
+    """Tag generated collider meshes with their cache key, part order and own geometry hash
+    
+    Meshes stored under key before, e.g. since edited, stop being cache
+    entries, so one key always holds one set.
+    """
+    new_meshes = [mesh for name, mesh in named_meshes]
+    for mesh in bpy.data.meshes:
+        if mesh.get("arvehicles_cache_key") == key and mesh not in new_meshes:
+            del mesh["arvehicles_cache_key"]
+    
+    for part, (name, mesh) in enumerate(named_meshes):
+        mesh["arvehicles_cache_key"] = key
+        mesh["arvehicles_cache_part"] = part
+        mesh["arvehicles_cache_name"] = name
+        mesh["arvehicles_cache_hash"] = _mesh_buffer_digest(mesh).hexdigest()
+
+def find_cached_colliders(key):
+    """Get the [(object name, mesh)] stored under key, [] when missing or edited since"""
+    meshes = [mesh for mesh in bpy.data.meshes if mesh.get("arvehicles_cache_key") == key]
+    meshes.sort(key=lambda mesh: mesh["arvehicles_cache_part"])
+    
+    # Copies of a collider carry the tags too, only a clean, complete set is a hit
+    if [mesh["arvehicles_cache_part"] for mesh in meshes] != list(range(len(meshes))):
+        return []
+    if any(_mesh_buffer_digest(mesh).hexdigest() != mesh["arvehicles_cache_hash"] for mesh in meshes):
+        return []
+    return [(mesh["arvehicles_cache_name"], mesh) for mesh in meshes]
+
+def place_colliders(context, generator, mesh_objects, named_meshes, settings, parent_name=None, keep=(),
+                    part_sources=None):
+    """Put collider meshes on objects, replacing what generator made earlier from the same sources
+    
+    A previous collider is replaced when it was made from exactly these
+    sources, or on its own from one of them. Colliders of other sources are
+    never touched. Replaced objects are reused by name and swap their mesh in
+    place, leftovers are removed, so re-runs never leave .001 duplicates.
+    With part_sources, one source object per collider, each collider is made
+    from its own source only.
+    Previous colliders made from the sources in keep are left as they are.
+    With parent_name the colliders hang under the previous parent or a new empty.
+    Each collider records its sources, their fingerprints and the operator
+    settings, which is what Refresh Colliders works from.
+    Returns the collider objects in the order of named_meshes.
+    """
+    source_names = sorted(obj.name for obj in mesh_objects)
+    fingerprints = {obj.name: source_fingerprint(obj) for obj in mesh_objects}
+    kept = {obj.name for obj in keep}
+    previous = {}
+    for obj in context.scene.objects:
+        record = obj.get("arvehicles_collider")
+        if not record or record.get("generator") != generator:
+            continue
+        
+        # Parts that could not be regenerated keep their last good collider
+        sources = set(record.get("sources", []))
+        if sources & kept:
+            continue
+        if sources == set(source_names) or (record.get("per_source") and sources <= set(source_names)):
+            previous[obj.name] = obj
+    
+    parent = None
+    if parent_name is not None:
+        parent = next((obj.parent for obj in previous.values() if obj.parent), None)
+        if parent is None:
+            parent = bpy.data.objects.new(parent_name, None)
+            context.collection.objects.link(parent)
+    
+    targets = [previous.pop(name, None) for name, mesh in named_meshes]
+    
+    # Leftovers go first, which frees their names for the new objects
+    for obj in previous.values():
+        bpy.data.objects.remove(obj)
+    
+    colliders = []
+    for idx, ((name, mesh), obj) in enumerate(zip(named_meshes, targets)):
+        if obj is None:
+            obj = bpy.data.objects.new(name, mesh)
+            context.collection.objects.link(obj)
+        elif obj.data != mesh:
+            old_mesh = obj.data
+            obj.data = mesh
+            # Tagged meshes stay around as cache entries
+            if old_mesh.users == 0 and "arvehicles_cache_key" not in old_mesh:
+                bpy.data.meshes.remove(old_mesh)
+        
+        if parent is not None:
+            obj.parent = parent
+        
+        sources = source_names if part_sources is None else [part_sources[idx].name]
+        # A dict property, the FBX exporter leaves it out
+        obj["arvehicles_collider"] = {
+            "generator": generator,
+            "sources": sources,
+            "selection": source_names,
+            "per_source": part_sources is not None,
+            "fingerprints": {name: fingerprints[name] for name in sources},
+            "settings": settings,
+        }
+        colliders.append(obj)
+    
+    return colliders
+
+def mesh_from_buffers(name, buffers):
+    """Create a mesh from flat buffers: vertex positions, face sizes and face corners"""
+    loop_totals = buffers["loop_totals"]
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(buffers["coords"]) // 3)
+    mesh.loops.add(len(buffers["loop_vertices"]))
+    mesh.polygons.add(len(loop_totals))
+    mesh.vertices.foreach_set("co", buffers["coords"])
+    mesh.loops.foreach_set("vertex_index", buffers["loop_vertices"])
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    # Newer Blender versions derive the face sizes from the starts
+    if not mesh.polygons.bl_rna.properties["loop_total"].is_readonly:
+        mesh.polygons.foreach_set("loop_total", loop_totals)
+    mesh.update(calc_edges=True)
+    mesh.validate()
+    return mesh
+
+def _cluster_labels(coords, cell_size):
+    """Number the grid cells of size cell_size that the vertices fall in"""
+    cells = np.floor((coords - coords.min(axis=0)) / cell_size).astype(np.int64)
+    dims = cells.max(axis=0) + 1
+    codes = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    _, labels = np.unique(codes, return_inverse=True)
+    return labels.ravel()
+
+def _surviving_triangles(labels, triangles):
+    """Mask of the triangles whose corners stay in three different clusters"""
+    corners = labels[triangles]
+    return ((corners[:, 0] != corners[:, 1]) &
+            (corners[:, 1] != corners[:, 2]) &
+            (corners[:, 2] != corners[:, 0]))
+
+def cluster_vertices(coords, triangles, cell_size, outer=False):
+    """Merge the vertices sharing a grid cell into one, returns (coords, triangles)
+    
+    Each cell becomes the mean of its vertices, or with outer its vertex
+    farthest from the center of the part, which keeps protrusions and the
+    overall extents. Triangles that collapse or repeat another one are
+    dropped, as are the vertices no triangle uses any more.
+    """
+    labels = _cluster_labels(coords, cell_size)
+    if outer:
+        distances = np.linalg.norm(coords - coords.mean(axis=0), axis=1)
+        order = np.lexsort((-distances, labels))
+        _, first = np.unique(labels[order], return_index=True)
+        merged = coords[order[first]]
+    else:
+        counts = np.bincount(labels)
+        merged = np.column_stack([np.bincount(labels, weights=coords[:, axis]) for axis in range(3)]) / counts[:, None]
+    
+    triangles = labels[triangles[_surviving_triangles(labels, triangles)]]
+    _, first = np.unique(np.sort(triangles, axis=1), axis=0, return_index=True)
+    triangles = triangles[np.sort(first)]
+    
+    used = np.unique(triangles)
+    remap = np.zeros(len(merged), dtype=np.int64)
+    remap[used] = np.arange(len(used))
+    return merged[used], remap[triangles]
+
+def _box_triangles(coords):
+    """Get the axis-aligned box around points as 8 corners and 12 outward triangles"""
+    corners = np.array(list(itertools.product(*zip(coords.min(axis=0), coords.max(axis=0)))))
+    triangles = np.concatenate([BOX_CORNER_QUADS[:, [0, 1, 2]], BOX_CORNER_QUADS[:, [0, 2, 3]]])
+    return corners, triangles
+
+def _simplify_by_clustering(coords, triangles, target_faces, outer):
+    """Cluster vertices on the finest grid that brings the triangles within target_faces
+    
+    Parts that stay over budget even on the coarsest grid become their box.
+    """
+    if len(triangles) <= target_faces:
+        return coords, triangles
+    
+    extent = max(float(np.max(coords.max(axis=0) - coords.min(axis=0))), 1e-9)
+    
+    # Face count grows with the resolution, search for the largest one that fits.
+    # Counting survivors skips the duplicate removal, so the count errs on the safe side
+    low, high = 2, DETAILED_MAX_RESOLUTION
+    middle = DETAILED_START_RESOLUTION
+    while low < high:
+        labels = _cluster_labels(coords, extent / middle)
+        if np.count_nonzero(_surviving_triangles(labels, triangles)) <= target_faces:
+            low = middle
+        else:
+            high = middle - 1
+        middle = (low + high + 1) // 2
+    
+    coords, triangles = cluster_vertices(coords, triangles, extent / low, outer)
+    if len(triangles) > target_faces:
+        return _box_triangles(coords)
+    return coords, triangles
+
+def _offset_along_normals(coords, triangles, distance):
+    """Push vertices out along their area-weighted normals"""
+    corner = coords[triangles[:, 0]]
+    face_normals = np.cross(coords[triangles[:, 1]] - corner, coords[triangles[:, 2]] - corner)
+    normals = np.zeros_like(coords)
+    for column in range(3):
+        np.add.at(normals, triangles[:, column], face_normals)
+    
+    lengths = np.linalg.norm(normals, axis=1)
+    lengths[lengths == 0] = 1.0
+    return coords + normals / lengths[:, None] * distance
+
+def detailed_part_buffers(coords, triangles, target_faces, preserve_details, offset):
+    """Reduce world-space triangles to a Detailed FireGeo part, as mesh buffers
+    
+    Welds, simplifies by vertex clustering and offsets along the normals in
+    NumPy, so no operator, mode switch or depsgraph update is involved.
+    """
+    if len(triangles) > 0:
+        coords, triangles = cluster_vertices(coords, triangles, DETAILED_WELD_DISTANCE)
+        coords, triangles = _simplify_by_clustering(coords, triangles, target_faces, preserve_details)
+        if offset > 0:
+            coords = _offset_along_normals(coords, triangles, offset)
+    
+    return {
+        "coords": coords.astype(np.float32).ravel(),
+        "loop_totals": np.full(len(triangles), 3, dtype=np.int32),
+        "loop_vertices": triangles.astype(np.int32).ravel(),
+    }
+
+def _world_triangles(obj):
+    """Get the world-space vertices and loop triangles of a mesh object"""
+    return _transform_coords(_mesh_local_coords(obj.data), obj.matrix_world), _mesh_triangles(obj.data)
+
+def start_detailed_worker(job_dir, name, batch, preserve_details, offset):
+    """Write a batch of parts to one job file and start a background Blender on it
+    
+    batch holds (part name, coords, triangles, target faces) per part. The
+    worker is this file run with --python, so it needs no installed add-on,
+    and Blender only starts once for the whole batch.
+    Returns the process and the path each part's result will be written to.
+    """
+    job_path = os.path.join(job_dir, f"{name}_job.npz")
+    result_paths = [os.path.join(job_dir, f"{part_name}_result.npz") for part_name, coords, triangles, target in batch]
+    arrays = {}
+    for i, (part_name, coords, triangles, target_faces) in enumerate(batch):
+        arrays[f"coords_{i}"] = coords
+        arrays[f"triangles_{i}"] = triangles
+    np.savez(job_path, result_paths=np.array(result_paths),
+             target_faces=np.array([target_faces for part_name, coords, triangles, target_faces in batch]),
+             preserve_details=preserve_details, offset=offset, **arrays)
+    
+    command = [bpy.app.binary_path, "-b", "--factory-startup", "--python-exit-code", "1",
+               "--python", os.path.abspath(__file__), "--", DETAILED_WORKER_FLAG, job_path]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return process, result_paths
+
+def load_detailed_result(result_path, name):
+    """Load a part a worker finished as a mesh, None if its result is unreadable"""
+    try:
+        with np.load(result_path) as result:
+            buffers = {key: result[key] for key in ("coords", "loop_totals", "loop_vertices")}
+    except (OSError, ValueError, KeyError):
+        return None
+    return mesh_from_buffers(f"{name}_data", buffers)
+
+def run_detailed_worker(job_path):
+    """Process a batch of Detailed FireGeo jobs inside a background Blender
+    
+    Every part gets its own result file as soon as it is done, so a crash
+    or timeout later in the batch only loses the parts not built yet.
+    """
+    with np.load(job_path) as job:
+        preserve_details = bool(job["preserve_details"])
+        offset = float(job["offset"])
+        for i, result_path in enumerate(job["result_paths"]):
+            result_path = str(result_path)
+            try:
+                buffers = detailed_part_buffers(job[f"coords_{i}"], job[f"triangles_{i}"], int(job["target_faces"][i]),
+                                                preserve_details, offset)
+            except Exception:
+                # A part without result counts as failed, the rest of the batch still gets built
+                continue
+            
+            # Write under a temporary name, a half-written result must not look finished
+            partial_path = result_path[:-len(".npz")] + "_partial.npz"
+            np.savez(partial_path, **buffers)
+            os.replace(partial_path, result_path)
+
+def compute_scale_factors(current_dims, target_dims, preserve_proportions):
+    """Get (scale_x, scale_y, scale_z) that turn (length, width, height) into the target dimensions"""
+    length_scale, width_scale, height_scale = (
+        target / current if current > 0 else 1.0
+        for current, target in zip(current_dims, target_dims))
+    
+    # If preserving proportions, use the smallest scale to ensure it fits within limits
+    if preserve_proportions:
+        scale_factor = min(length_scale, width_scale, height_scale)
+        return scale_factor, scale_factor, scale_factor
+    
+    # Use non-uniform scaling to match exact dimensions
+    return width_scale, length_scale, height_scale
+
+# Box edges as index pairs into corners ordered by (x, y, z) sign bits
+BOX_EDGE_INDICES = (
+    (0, 1), (2, 3), (4, 5), (6, 7),
+    (0, 2), (1, 3), (4, 6), (5, 7),
+    (0, 4), (1, 5), (2, 6), (3, 7),
+)
+
+# Target box drawn in the viewport while the Scale Vehicle dialog is open
+_scale_preview = {"handle": None, "corners": None, "dialog_open": False}
+
+def _uniform_color_shader():
+    """Get the builtin flat color shader (renamed in Blender 3.4)"""
+    try:
+        return gpu.shader.from_builtin('UNIFORM_COLOR')
+    except ValueError:
+        return gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+
+def _draw_scale_preview():
+    corners = _scale_preview["corners"]
+    if corners is None:
+        return
+    
+    shader = _uniform_color_shader()
+    batch = batch_for_shader(shader, 'LINES', {"pos": corners}, indices=BOX_EDGE_INDICES)
+    shader.bind()
+    shader.uniform_float("color", (1.0, 0.6, 0.1, 1.0))
+    batch.draw(shader)
+
+def set_scale_preview(center, dimensions=None):
+    """Show a (length, width, height) box around center in the viewport, or hide it with None
+    
+    Called from operator draw(), so nothing is touched unless the box changed.
+    """
+    corners = None
+    if center is not None:
+        length, width, height = dimensions
+        half = (width / 2, length / 2, height / 2)
+        corners = [
+            (center[0] + sx * half[0], center[1] + sy * half[1], center[2] + sz * half[2])
+            for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)
+        ]
+    
+    if corners == _scale_preview["corners"] and (corners is None) == (_scale_preview["handle"] is None):
+        return
+    
+    _scale_preview["corners"] = corners
+    if corners is None:
+        if _scale_preview["handle"] is not None:
+            bpy.types.SpaceView3D.draw_handler_remove(_scale_preview["handle"], 'WINDOW')
+            _scale_preview["handle"] = None
+    elif _scale_preview["handle"] is None:
+        _scale_preview["handle"] = bpy.types.SpaceView3D.draw_handler_add(
+            _draw_scale_preview, (), 'WINDOW', 'POST_VIEW')
+    
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+@persistent
+def _bounds_cache_depsgraph_update(scene, depsgraph):
+    """Drop cached bounds whose mesh geometry or object transform changed"""
+    if not _bounds_cache and not _hull_points_cache:
+        return
+    
+    for update in depsgraph.updates:
+        datablock = update.id.original
+        
+        if isinstance(datablock, bpy.types.Mesh):
+            # Geometry edits invalidate every instance of the mesh
+            invalidate_bounds_cache(datablock)
+        
+        elif isinstance(datablock, bpy.types.Object) and datablock.type == 'MESH':
+            if update.is_updated_geometry:
+                invalidate_bounds_cache(datablock.data)
+            elif update.is_updated_transform:
+                # Only the entry for the matrix this object was measured with is stale
+                keys = _object_bounds_keys.pop(datablock.as_pointer(), None)
+                if keys is not None:
+                    mesh_key, matrix_key = keys
+                    _bounds_cache.get(mesh_key, {}).pop(matrix_key, None)
+
+@persistent
+def _bounds_cache_load_post(dummy):
+    """Datablock pointers are not valid across files"""
+    invalidate_bounds_cache()
+
 class ARVEHICLES_OT_orient_vehicle(bpy.types.Operator):
     """Orient vehicle along the Y+ axis (Blender) as required by Arma Reforger"""
     bl_idname = "arvehicles.orient_vehicle"
     bl_label = "Orient Vehicle to center"
     bl_options = {'REGISTER', 'UNDO'}
     
+    forward_axis: bpy.props.EnumProperty(
+        name="Forward Axis",
+        description="Direction the front of the vehicle currently faces",
+        items=[
+            ('AUTO', "Auto Detect", "Find the length axis with PCA and detect the front from the vehicle shape"),
+            ('POS_Y', "+Y", "Vehicle already faces +Y, only center it"),
+            ('NEG_Y', "-Y", "Vehicle faces -Y"),
+            ('POS_X', "+X", "Vehicle faces +X"),
+            ('NEG_X', "-X", "Vehicle faces -X"),
+        ],
+        default='AUTO'
+    )
+    
+    defer_bake: bpy.props.BoolProperty(
+        name="Defer Mesh Bake",
+        description="Only move the objects now and bake rotation into the meshes later, before export or with Bake Pending Transforms",
+        default=False
+    )
+    
     def execute(self, context):
         if len(context.selected_objects) == 0:
             self.report({'ERROR'}, "Please select the vehicle meshes")
@@ -99,62 +1903,32 @@ class ARVEHICLES_OT_orient_vehicle(bpy.types.Operator):
             self.report({'ERROR'}, "No mesh objects selected")
             return {'CANCELLED'}
         
-        # Create an empty at the world origin to use as a pivot
-        pivot = bpy.data.objects.new("RotationPivot", None)
-        context.collection.objects.link(pivot)
-        pivot.location = (0, 0, 0)
-        
-        # Calculate current vehicle dimensions and center
-        min_x, min_y, min_z = float('inf'), float('inf'), float('inf')
-        max_x, max_y, max_z = float('-inf'), float('-inf'), float('-inf')
+        # Determine the rotation about Z that makes the vehicle face Y+
+        heading = compute_vehicle_heading(mesh_objects, self.forward_axis)
+        if heading is None:
+            self.report({'ERROR'}, "Selected meshes have no vertices")
+            return {'CANCELLED'}
+        angle, confidence = heading
+        rotation = Matrix.Rotation(angle, 4, 'Z')
         
-        for obj in mesh_objects:
-            for vert in obj.data.vertices:
-                world_co = obj.matrix_world @ vert.co
-                min_x = min(min_x, world_co.x)
-                min_y = min(min_y, world_co.y)
-                min_z = min(min_z, world_co.z)
-                max_x = max(max_x, world_co.x)
-                max_y = max(max_y, world_co.y)
-                max_z = max(max_z, world_co.z)
+        # Calculate vehicle dimensions and center after the rotation
+        min_x, min_y, min_z, max_x, max_y, max_z = get_world_bounds(mesh_objects, rotation)
         
         # Calculate center of vehicle
         center_x = (min_x + max_x) / 2
         center_y = (min_y + max_y) / 2
         center_z = (min_z + max_z) / 2
         
-        # Store original parents and parenting temporarily
-        original_parents = {}
-        original_locations = {}
-        for obj in mesh_objects:
-            original_parents[obj] = obj.parent
-            original_locations[obj] = obj.location.copy()
-            obj.parent = pivot
-        
-        # Orient the vehicle to Y+ axis (this assumes vehicle is initially facing along X+ or Z+)
-        # You may need to adjust this rotation based on your initial orientation
-        pivot.rotation_euler = (0, 0, 0)
-        
-        # First apply rotation to ensure vehicle faces Y+
-        bpy.ops.object.select_all(action='DESELECT')
-        pivot.select_set(True)
-        context.view_layer.objects.active = pivot
-        bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-        
-        # Move pivot to center of vehicle
-        pivot.location = (-center_x, -center_y, -center_z)
-        
-        # Apply location to center the vehicle at world origin
-        bpy.ops.object.transform_apply(location=True, rotation=False, scale=False)
+        # Rotate about the origin, then move the rotated center to the origin
+        transform = Matrix.Translation((-center_x, -center_y, -center_z)) @ rotation
+        apply_world_transform(mesh_objects, transform, deferred=self.defer_bake)
         
-        # Restore original parenting
-        for obj in mesh_objects:
-            obj.parent = original_parents[obj]
-        
-        # Remove the temporary pivot
-        bpy.data.objects.remove(pivot)
-        
-        self.report({'INFO'}, "Vehicle oriented along Y+ axis and centered at origin")
+        message = f"Vehicle rotated {math.degrees(angle):.1f}° to face Y+ and centered at origin"
+        if confidence is not None and confidence < ORIENT_CONFIDENCE_WARNING:
+            message += f" (front detection uncertain at {confidence:.0%}, set Forward Axis if it faces backwards)"
+            self.report({'WARNING'}, message)
+        else:
+            self.report({'INFO'}, message)
         return {'FINISHED'}
     
 class ARVEHICLES_OT_scale_vehicle(bpy.types.Operator):
@@ -245,10 +2019,23 @@ class ARVEHICLES_OT_scale_vehicle(bpy.types.Operator):
         default=True
     )
     
-    # Store the current dimensions for UI display
-    current_length: bpy.props.FloatProperty(default=0.0)
-    current_width: bpy.props.FloatProperty(default=0.0)
-    current_height: bpy.props.FloatProperty(default=0.0)
+    defer_bake: bpy.props.BoolProperty(
+        name="Defer Mesh Bake",
+        description="Only scale the objects now and bake the scale into the meshes later, before export or with Bake Pending Transforms",
+        default=False
+    )
+    
+    show_preview: bpy.props.BoolProperty(
+        name="Show Target Box",
+        description="Draw the resulting vehicle box in the viewport while the dialog is open",
+        default=True
+    )
+    
+    # Store the current dimensions for UI display, measured once in invoke
+    current_length: bpy.props.FloatProperty(default=0.0, options={'HIDDEN', 'SKIP_SAVE'})
+    current_width: bpy.props.FloatProperty(default=0.0, options={'HIDDEN', 'SKIP_SAVE'})
+    current_height: bpy.props.FloatProperty(default=0.0, options={'HIDDEN', 'SKIP_SAVE'})
+    current_center: bpy.props.FloatVectorProperty(size=3, options={'HIDDEN', 'SKIP_SAVE'})
     
     def invoke(self, context, event):
         # Calculate current vehicle dimensions
@@ -260,58 +2047,25 @@ class ARVEHICLES_OT_scale_vehicle(bpy.types.Operator):
                 self.current_length = max_y - min_y  # Assuming Y is length
                 self.current_width = max_x - min_x   # Width is along X
                 self.current_height = max_z - min_z  # Height is along Z
+                self.current_center = ((min_x + max_x) / 2, (min_y + max_y) / 2, (min_z + max_z) / 2)
         
-        return context.window_manager.invoke_props_dialog(self, width=350)
+        # The redo panel reuses draw(), only preview while the dialog is open
+        _scale_preview["dialog_open"] = True
+        return context.window_manager.invoke_props_dialog(self, width=420)
+    
+    def cancel(self, context):
+        _scale_preview["dialog_open"] = False
+        set_scale_preview(None)
     
     def _get_dimensions(self, mesh_objects):
-        min_x, min_y, min_z = float('inf'), float('inf'), float('inf')
-        max_x, max_y, max_z = float('-inf'), float('-inf'), float('-inf')
-        
-        for obj in mesh_objects:
-            for vert in obj.data.vertices:
-                world_co = obj.matrix_world @ vert.co
-                min_x = min(min_x, world_co.x)
-                min_y = min(min_y, world_co.y)
-                min_z = min(min_z, world_co.z)
-                max_x = max(max_x, world_co.x)
-                max_y = max(max_y, world_co.y)
-                max_z = max(max_z, world_co.z)
-                
-        return min_x, min_y, min_z, max_x, max_y, max_z
-    def execute(self, context):
-        # Check if objects are selected
-        if len(context.selected_objects) == 0:
-            self.report({'ERROR'}, "Please select the vehicle meshes")
-            return {'CANCELLED'}
-        
-        # Find all mesh objects in selection
-        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
-        
-        if not mesh_objects:
-            self.report({'ERROR'}, "No mesh objects selected")
-            return {'CANCELLED'}
-        
-        # Calculate current vehicle dimensions and center
-        min_x, min_y, min_z, max_x, max_y, max_z = self._get_dimensions(mesh_objects)
-        
-        # Calculate center of vehicle
-        center_x = (min_x + max_x) / 2
-        center_y = (min_y + max_y) / 2
-        center_z = (min_z + max_z) / 2
-        
-        # Calculate current dimensions
-        current_length = max_y - min_y  # Assuming Y is length axis after orientation
-        current_width = max_x - min_x   # Width is along X
-        current_height = max_z - min_z  # Height is along Z
-        
-        # Get target dimensions based on scaling method
+        return get_world_bounds(mesh_objects)
+    
+    def _get_target_dimensions(self):
+        """Get the target (length, width, height) for the chosen scaling method"""
         if self.scale_method == 'preset':
             # Use the selected vehicle preset
-            vehicle_dims = VEHICLE_SCALES.get(self.vehicle_type, VEHICLE_SCALES['your_model'])
-            target_length = vehicle_dims[0]
-            target_width = vehicle_dims[1]
-            target_height = vehicle_dims[2]
-            
+            return VEHICLE_SCALES.get(self.vehicle_type, VEHICLE_SCALES['your_model'])
+        
         elif self.scale_method == 'realworld':
             # Calculate scaling relative to the reference vehicle (VW Golf)
             # This uses the real-world dimensions provided by the user
@@ -325,70 +2079,68 @@ class ARVEHICLES_OT_scale_vehicle(bpy.types.Operator):
             height_ratio = self.realworld_height / ref_height
             
             # Apply these ratios to determine target dimensions
-            target_length = ref_length * length_ratio
-            target_width = ref_width * width_ratio
-            target_height = ref_height * height_ratio
-            
-        else:  # custom
-            target_length = self.custom_length
-            target_width = self.custom_width
-            target_height = self.custom_height
+            return ref_length * length_ratio, ref_width * width_ratio, ref_height * height_ratio
         
-        # Calculate the scale factors
-        length_scale = target_length / current_length if current_length > 0 else 1.0
-        width_scale = target_width / current_width if current_width > 0 else 1.0
-        height_scale = target_height / current_height if current_height > 0 else 1.0
-        
-        # If preserving proportions, use the smallest scale to ensure it fits within limits
-        if self.preserve_proportions:
-            scale_factor = min(length_scale, width_scale, height_scale)
-            # Use uniform scaling
-            scale_x = scale_y = scale_z = scale_factor
-        else:
-            # Use non-uniform scaling to match exact dimensions
-            scale_x = width_scale
-            scale_y = length_scale
-            scale_z = height_scale
-        
-        # Create an empty at the center to use as a scaling pivot
-        pivot = bpy.data.objects.new("ScalePivot", None)
-        context.collection.objects.link(pivot)
-        pivot.location = (center_x, center_y, center_z)
-        
-        # Parent all mesh objects to the pivot temporarily
-        original_parents = {}
-        for obj in mesh_objects:
-            original_parents[obj] = obj.parent
-            obj.parent = pivot
+        else:  # custom
+            return self.custom_length, self.custom_width, self.custom_height
+    
+    def execute(self, context):
+        _scale_preview["dialog_open"] = False
+        set_scale_preview(None)
         
-        # Scale the pivot, which scales all children around the center
-        if self.preserve_proportions:
-            pivot.scale = (scale_factor, scale_factor, scale_factor)
-        else:
-            pivot.scale = (scale_x, scale_y, scale_z)
+        # Check if objects are selected
+        if len(context.selected_objects) == 0:
+            self.report({'ERROR'}, "Please select the vehicle meshes")
+            return {'CANCELLED'}
         
-        # Apply the scale to all children
-        bpy.ops.object.select_all(action='DESELECT')
-        pivot.select_set(True)
-        context.view_layer.objects.active = pivot
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        # Find all mesh objects in selection
+        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
         
-        # Restore original parenting
-        for obj in mesh_objects:
-            obj.parent = original_parents[obj]
+        if not mesh_objects:
+            self.report({'ERROR'}, "No mesh objects selected")
+            return {'CANCELLED'}
         
-        # Remove the temporary pivot
-        bpy.data.objects.remove(pivot)
+        if self.current_length > 0:
+            # Dimensions were measured in invoke, no need to measure again
+            center_x, center_y, center_z = self.current_center
+            current_length = self.current_length
+            current_width = self.current_width
+            current_height = self.current_height
+        else:
+            # Calculate current vehicle dimensions and center
+            min_x, min_y, min_z, max_x, max_y, max_z = self._get_dimensions(mesh_objects)
+            
+            # Calculate center of vehicle
+            center_x = (min_x + max_x) / 2
+            center_y = (min_y + max_y) / 2
+            center_z = (min_z + max_z) / 2
+            
+            # Calculate current dimensions
+            current_length = max_y - min_y  # Assuming Y is length axis after orientation
+            current_width = max_x - min_x   # Width is along X
+            current_height = max_z - min_z  # Height is along Z
+        
+        # Calculate the scale factors for the chosen target dimensions
+        scale_x, scale_y, scale_z = compute_scale_factors(
+            (current_length, current_width, current_height),
+            self._get_target_dimensions(),
+            self.preserve_proportions)
+        
+        # Scale about the vehicle center
+        center = Vector((center_x, center_y, center_z))
+        scale_matrix = Matrix.Diagonal((scale_x, scale_y, scale_z, 1.0))
+        transform = Matrix.Translation(center) @ scale_matrix @ Matrix.Translation(-center)
+        apply_world_transform(mesh_objects, transform, deferred=self.defer_bake)
         
         # Log the dimensions for reference
         if self.preserve_proportions:
             self.report({'INFO'}, 
-                f"Vehicle scaled uniformly by factor: {scale_factor:.4f}\n"
-                f"Dimensions (L×W×H): {current_length*scale_factor:.2f}m × {current_width*scale_factor:.2f}m × {current_height*scale_factor:.2f}m")
+                f"Vehicle scaled uniformly by factor: {scale_x:.4f}\n"
+                f"Dimensions (L×W×H): {current_length*scale_y:.2f}m × {current_width*scale_x:.2f}m × {current_height*scale_z:.2f}m")
         else:
             self.report({'INFO'}, 
-                f"Vehicle scaled non-uniformly (L×W×H): {length_scale:.2f} × {width_scale:.2f} × {height_scale:.2f}\n"
-                f"Final dimensions: {current_length*length_scale:.2f}m × {current_width*width_scale:.2f}m × {current_height*height_scale:.2f}m")
+                f"Vehicle scaled non-uniformly (L×W×H): {scale_y:.2f} × {scale_x:.2f} × {scale_z:.2f}\n"
+                f"Final dimensions: {current_length*scale_y:.2f}m × {current_width*scale_x:.2f}m × {current_height*scale_z:.2f}m")
         
         return {'FINISHED'}
     
@@ -459,6 +2211,250 @@ class ARVEHICLES_OT_scale_vehicle(bpy.types.Operator):
         
         # Proportional scaling option
         layout.prop(self, "preserve_proportions")
+        layout.prop(self, "defer_bake")
+        layout.prop(self, "show_preview")
+        
+        if self.current_length <= 0:
+            return
+        
+        # Live preview from the dimensions measured in invoke, no mesh access
+        current = (self.current_length, self.current_width, self.current_height)
+        target_scale = compute_scale_factors(current, self._get_target_dimensions(), self.preserve_proportions)
+        result = (self.current_length * target_scale[1], self.current_width * target_scale[0], self.current_height * target_scale[2])
+        
+        box = layout.box()
+        box.label(text="Result:")
+        row = box.row()
+        row.label(text=f"L×W×H: {result[0]:.2f} × {result[1]:.2f} × {result[2]:.2f}m")
+        row.label(text=f"Scale: {target_scale[1]:.3f} × {target_scale[0]:.3f} × {target_scale[2]:.3f}")
+        
+        box = layout.box()
+        box.label(text="All Presets (L×W×H result, scale):")
+        col = box.column(align=True)
+        for preset_name, preset_dims in VEHICLE_SCALES.items():
+            preset_scale = compute_scale_factors(current, preset_dims, self.preserve_proportions)
+            row = col.row()
+            selected = self.scale_method == 'preset' and preset_name == self.vehicle_type
+            row.label(text=preset_name, icon='RIGHTARROW' if selected else 'BLANK1')
+            row.label(text=f"{self.current_length * preset_scale[1]:.2f} × {self.current_width * preset_scale[0]:.2f} × {self.current_height * preset_scale[2]:.2f}m")
+            row.label(text=f"{preset_scale[1]:.3f} × {preset_scale[0]:.3f} × {preset_scale[2]:.3f}")
+        
+        # Target box in the viewport, drawn until the dialog closes
+        if self.show_preview and _scale_preview["dialog_open"]:
+            set_scale_preview(self.current_center, result)
+        else:
+            set_scale_preview(None)
+
+class ARVEHICLES_PG_batch_collection(bpy.types.PropertyGroup):
+    """Vehicle collection entry for batch orient/scale"""
+    enabled: bpy.props.BoolProperty(
+        name="Include",
+        description="Orient and scale the vehicle in this collection",
+        default=True
+    )
+
+class ARVEHICLES_PG_collider_metrics(bpy.types.PropertyGroup):
+    """Result of the last collider analysis, shown in the panel"""
+    collider: bpy.props.StringProperty(name="Collider")
+    samples: bpy.props.IntProperty(name="Samples")
+    visual_to_collider: bpy.props.FloatProperty(name="Visual to Collider", unit='LENGTH')
+    collider_to_visual: bpy.props.FloatProperty(name="Collider to Visual", unit='LENGTH')
+    hausdorff: bpy.props.FloatProperty(name="Hausdorff", unit='LENGTH')
+    rms: bpy.props.FloatProperty(name="RMS", unit='LENGTH')
+
+class ARVEHICLES_OT_batch_prepare(bpy.types.Operator):
+    """Orient and scale several vehicles at once, one collection per vehicle"""
+    bl_idname = "arvehicles.batch_prepare"
+    bl_label = "Batch Orient/Scale"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    vehicle_collections: bpy.props.CollectionProperty(type=ARVEHICLES_PG_batch_collection)
+    
+    orient: bpy.props.BoolProperty(
+        name="Orient",
+        description="Rotate each vehicle to face Y+",
+        default=True
+    )
+    
+    forward_axis: bpy.props.EnumProperty(
+        name="Forward Axis",
+        description="Direction the front of the vehicles currently faces",
+        items=[
+            ('AUTO', "Auto Detect", "Find the length axis with PCA and detect the front from the vehicle shape"),
+            ('POS_Y', "+Y", "Vehicles already face +Y"),
+            ('NEG_Y', "-Y", "Vehicles face -Y"),
+            ('POS_X', "+X", "Vehicles face +X"),
+            ('NEG_X', "-X", "Vehicles face -X"),
+        ],
+        default='AUTO'
+    )
+    
+    scale: bpy.props.BoolProperty(
+        name="Scale",
+        description="Scale each vehicle to the preset dimensions",
+        default=True
+    )
+    
+    vehicle_type: bpy.props.EnumProperty(
+        name="Vehicle Type",
+        description="Preset dimensions every vehicle is scaled to",
+        items=[
+            ('your_model', "Your Model (4.07×1.8×1.46m)", "Use your exact vehicle measurements"),
+            ('golf_reference', "VW Golf Reference (4.282×1.789×1.483m)", "Use VW Golf as reference (Arma example)"),
+            ('sedan', "Sedan", "Standard sedan car"),
+            ('suv', "SUV", "Sport utility vehicle"),
+            ('truck', "Truck", "Pickup or larger truck"),
+            ('jeep', "Jeep", "Military jeep or similar"),
+            ('van', "Van", "Delivery van or similar"),
+            ('apc', "APC", "Armored Personnel Carrier"),
+        ],
+        default='your_model'
+    )
+    
+    preserve_proportions: bpy.props.BoolProperty(
+        name="Preserve Proportions",
+        description="Scale uniformly to fit within target dimensions while preserving original proportions",
+        default=True
+    )
+    
+    keep_positions: bpy.props.BoolProperty(
+        name="Keep Positions",
+        description="Transform each vehicle about its own center instead of moving them all to the world origin",
+        default=True
+    )
+    
+    defer_bake: bpy.props.BoolProperty(
+        name="Defer Mesh Bake",
+        description="Only move the objects now and bake into the meshes later, before export or with Bake Pending Transforms",
+        default=False
+    )
+    
+    # Before/after dimension table of the last run, one line per vehicle
+    summary: bpy.props.StringProperty(default="", options={'HIDDEN', 'SKIP_SAVE'})
+    
+    def invoke(self, context, event):
+        # List every collection that holds meshes, but only leaf collections start enabled,
+        # parents like "Collection" or a "Vehicles" folder usually just group the vehicles
+        self.vehicle_collections.clear()
+        for collection in bpy.data.collections:
+            if any(obj.type == 'MESH' for obj in collection.all_objects):
+                item = self.vehicle_collections.add()
+                item.name = collection.name
+                item.enabled = not any(
+                    obj.type == 'MESH' for child in collection.children for obj in child.all_objects)
+        
+        if not self.vehicle_collections:
+            self.report({'ERROR'}, "No collections with meshes found")
+            return {'CANCELLED'}
+        
+        return context.window_manager.invoke_props_dialog(self, width=400)
+    
+    def execute(self, context):
+        # Gather the vehicles, each object is only transformed with the first collection it is in.
+        # Smaller collections claim first, so a child vehicle is never swallowed by an enabled parent
+        collections = [bpy.data.collections.get(item.name) for item in self.vehicle_collections if item.enabled]
+        collections = sorted((c for c in collections if c is not None), key=lambda c: len(c.all_objects))
+        
+        vehicles = []
+        claimed = set()
+        for collection in collections:
+            mesh_objects = [obj for obj in collection.all_objects if obj.type == 'MESH' and obj not in claimed]
+            if mesh_objects:
+                claimed.update(mesh_objects)
+                vehicles.append((collection.name, mesh_objects))
+        
+        if not vehicles:
+            self.report({'ERROR'}, "No vehicle collections selected")
+            return {'CANCELLED'}
+        
+        # Headings come first, they need each vehicle's own vertex sample
+        plans = []
+        uncertain = []
+        for name, mesh_objects in vehicles:
+            if not any(len(obj.data.vertices) for obj in mesh_objects):
+                continue
+            
+            angle = 0.0
+            if self.orient:
+                heading = compute_vehicle_heading(mesh_objects, self.forward_axis)
+                if heading is None:
+                    continue
+                angle, confidence = heading
+                if confidence is not None and confidence < ORIENT_CONFIDENCE_WARNING:
+                    uncertain.append(name)
+            plans.append((name, mesh_objects, angle))
+        
+        if not plans:
+            self.report({'ERROR'}, "Selected vehicle collections have no vertices")
+            return {'CANCELLED'}
+        
+        # Measure every vehicle before anything moves, all in one sweep
+        before_bounds, rotated_bounds = get_batch_world_bounds(
+            [mesh_objects for name, mesh_objects, angle in plans], [angle for name, mesh_objects, angle in plans])
+        
+        # Apply the per-vehicle transforms, all inside this one undo step
+        rows = []
+        for (name, mesh_objects, angle), before, rotated in zip(plans, before_bounds, rotated_bounds):
+            rotation = Matrix.Rotation(angle, 4, 'Z')
+            min_x, min_y, min_z, max_x, max_y, max_z = rotated
+            current = (max_y - min_y, max_x - min_x, max_z - min_z)
+            rotated_center = Vector(((min_x + max_x) / 2, (min_y + max_y) / 2, (min_z + max_z) / 2))
+            
+            scale_factors = (1.0, 1.0, 1.0)
+            if self.scale:
+                scale_factors = compute_scale_factors(current, VEHICLE_SCALES[self.vehicle_type], self.preserve_proportions)
+            scale_matrix = Matrix.Diagonal((*scale_factors, 1.0))
+            
+            # Rotate, move the rotated center to the origin and scale there
+            transform = scale_matrix @ Matrix.Translation(-rotated_center) @ rotation
+            if self.keep_positions:
+                # ...then put the center back where it was before the rotation
+                transform = Matrix.Translation(rotation.inverted() @ rotated_center) @ transform
+            
+            apply_world_transform(mesh_objects, transform, deferred=self.defer_bake)
+            
+            before_dims = (before[4] - before[1], before[3] - before[0], before[5] - before[2])
+            after_dims = (current[0] * scale_factors[1], current[1] * scale_factors[0], current[2] * scale_factors[2])
+            rows.append((name, before_dims, after_dims))
+        
+        # Keep the before/after dimension table for draw, it shows in the Adjust Last Operation panel
+        self.summary = "\n".join(f"{name}: {b[0]:.2f}×{b[1]:.2f}×{b[2]:.2f}m -> {a[0]:.2f}×{a[1]:.2f}×{a[2]:.2f}m"
+                                 for name, b, a in rows)
+        if uncertain:
+            self.report({'WARNING'}, f"Oriented/scaled {len(rows)} vehicles, front detection uncertain for "
+                                     f"{', '.join(uncertain)}, set Forward Axis if they face backwards")
+        else:
+            self.report({'INFO'}, f"Oriented/scaled {len(rows)} vehicles")
+        return {'FINISHED'}
+    
+    def draw(self, context):
+        layout = self.layout
+        
+        box = layout.box()
+        box.label(text="Vehicle Collections:")
+        col = box.column(align=True)
+        for item in self.vehicle_collections:
+            col.prop(item, "enabled", text=item.name)
+        
+        layout.prop(self, "orient")
+        if self.orient:
+            layout.prop(self, "forward_axis")
+        
+        layout.prop(self, "scale")
+        if self.scale:
+            layout.prop(self, "vehicle_type")
+            layout.prop(self, "preserve_proportions")
+        
+        layout.prop(self, "keep_positions")
+        layout.prop(self, "defer_bake")
+        
+        # Results of the last run, only set once the operator has executed
+        if self.summary:
+            box = layout.box()
+            box.label(text="Vehicle: before L×W×H -> after L×W×H", icon='INFO')
+            col = box.column(align=True)
+            for line in self.summary.split("\n"):
+                col.label(text=line)
 
 class ARVEHICLES_OT_create_ucx_collision(bpy.types.Operator):
     """Create UCX collision (physics) for the vehicle with optimized face count"""
@@ -466,9 +2462,22 @@ class ARVEHICLES_OT_create_ucx_collision(bpy.types.Operator):
     bl_label = "Create UCX Collision"
     bl_options = {'REGISTER', 'UNDO'}
     
+    method: bpy.props.EnumProperty(
+        name="Method",
+        description="Shape of the UCX collision",
+        items=UCX_TIERS,
+        default='SIMPLIFIED'
+    )
+    
+    oriented_box: bpy.props.BoolProperty(
+        name="Oriented Box",
+        description="Align the box with the principal axes of the vehicle instead of the world axes",
+        default=False
+    )
+    
     target_faces: bpy.props.IntProperty(
         name="Target Faces",
-        description="Target number of faces for the collision mesh",
+        description="Target number of faces for the collision mesh (shared by all parts)",
         default=60,
         min=20,
         max=300
@@ -483,76 +2492,69 @@ class ARVEHICLES_OT_create_ucx_collision(bpy.types.Operator):
         step=0.001
     )
     
-    def execute(self, context):
-        # Check if objects are selected
-        if len(context.selected_objects) == 0:
-            self.report({'ERROR'}, "Please select the vehicle meshes")
-            return {'CANCELLED'}
-        
-        # Find all mesh objects in selection
-        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
-        
-        if not mesh_objects:
-            self.report({'ERROR'}, "No mesh objects selected")
-            return {'CANCELLED'}
-        
-        # Create a new object that will become our collision mesh
-        collision_mesh = bpy.data.meshes.new("UCX_body_mesh")
-        collision_obj = bpy.data.objects.new("UCX_body", collision_mesh)
-        context.collection.objects.link(collision_obj)
-        
-        # Combine all selected meshes into temporary mesh
-        temp_mesh = bpy.data.meshes.new("temp_mesh")
-        temp_obj = bpy.data.objects.new("temp_obj", temp_mesh)
-        context.collection.objects.link(temp_obj)
-        
-        # Add vertices from all selected objects
-        all_verts = []
-        for obj in mesh_objects:
-            for vert in obj.data.vertices:
-                world_co = obj.matrix_world @ vert.co
-                all_verts.append(world_co)
-        
-        # Create the temporary mesh from vertices
-        temp_mesh.from_pydata(all_verts, [], [])
-        temp_mesh.update()
-        
-        # Select the temporary object
-        bpy.ops.object.select_all(action='DESELECT')
-        temp_obj.select_set(True)
-        context.view_layer.objects.active = temp_obj
-        
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Select all vertices
-        bpy.ops.mesh.select_all(action='SELECT')
-        
-        # Create convex hull
-        bpy.ops.mesh.convex_hull()
-        
-        # Return to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Apply decimate modifier to reduce face count
-        decimate = temp_obj.modifiers.new(name="Decimate", type='DECIMATE')
-        current_faces = len(temp_obj.data.polygons)
-        decimate.ratio = min(1.0, self.target_faces / max(1, current_faces))
-        bpy.ops.object.modifier_apply(modifier=decimate.name)
+    # Parameters for Convex Decomposition method
+    max_parts: bpy.props.IntProperty(
+        name="Max Parts",
+        description="Maximum number of convex parts",
+        default=8,
+        min=2,
+        max=32
+    )
+    
+    max_concavity: bpy.props.FloatProperty(
+        name="Max Concavity",
+        description="Stop splitting once every part fills its hull to within this fraction of the vehicle volume",
+        default=0.02,
+        min=0.001,
+        max=0.5,
+        precision=3
+    )
+    
+    resolution: bpy.props.IntProperty(
+        name="Resolution",
+        description="Voxels along the longest side of the vehicle",
+        default=40,
+        min=16,
+        max=128
+    )
+    
+    # Probe hull measured in invoke, drives the estimates in the dialog
+    vertex_count: bpy.props.IntProperty(default=0, options={'HIDDEN', 'SKIP_SAVE'})
+    probe_points: bpy.props.IntProperty(default=0, options={'HIDDEN', 'SKIP_SAVE'})
+    probe_faces: bpy.props.IntProperty(default=0, options={'HIDDEN', 'SKIP_SAVE'})
+    probe_seconds: bpy.props.FloatProperty(default=0.0, options={'HIDDEN', 'SKIP_SAVE'})
+    
+    def execute(self, context):
+        # Check if objects are selected
+        if len(context.selected_objects) == 0:
+            self.report({'ERROR'}, "Please select the vehicle meshes")
+            return {'CANCELLED'}
         
-        # Add padding if needed
-        if self.padding > 0:
-            # Apply solidify modifier
-            solidify = temp_obj.modifiers.new(name="Solidify", type='SOLIDIFY')
-            solidify.thickness = self.padding
-            solidify.offset = 1.0  # Expand outward
-            bpy.ops.object.modifier_apply(modifier=solidify.name)
+        # Find all mesh objects in selection
+        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
         
-        # Transfer the mesh data to our collision object
-        collision_obj.data = temp_obj.data.copy()
+        if not mesh_objects:
+            self.report({'ERROR'}, "No mesh objects selected")
+            return {'CANCELLED'}
         
-        # Remove the temporary object
-        bpy.data.objects.remove(temp_obj)
+        # Unchanged meshes with the same settings reuse the colliders of an earlier run
+        # Every part is fitted to all sources together, so any edit rebuilds the whole set
+        key = collider_cache_key("UCX", mesh_objects, self._cache_params())
+        collision_meshes = find_cached_colliders(key)
+        cached = bool(collision_meshes)
+        
+        if not cached:
+            if self.method == 'BOX':
+                collision_meshes = self._build_box_meshes(mesh_objects)
+            elif self.method == 'DECOMPOSE':
+                collision_meshes = self._build_decomposed_meshes(mesh_objects)
+            else:
+                collision_meshes = self._build_hull_meshes(mesh_objects)
+            
+            if not collision_meshes:
+                self.report({'ERROR'}, "Selected meshes are flat, cannot build a convex hull")
+                return {'CANCELLED'}
+            store_collider_meshes(key, collision_meshes)
         
         # Create and assign material
         if "UCX_Material" not in bpy.data.materials:
@@ -561,26 +2563,170 @@ class ARVEHICLES_OT_create_ucx_collision(bpy.types.Operator):
         else:
             mat = bpy.data.materials["UCX_Material"]
         
-        # Assign material
-        collision_obj.data.materials.append(mat)
+        # Replace the colliders of the previous run in place
+        settings = self.as_keywords(ignore=("vertex_count", "probe_points", "probe_faces", "probe_seconds"))
+        collision_objects = place_colliders(context, "UCX", mesh_objects, collision_meshes, settings)
         
-        # Select the collision object
         bpy.ops.object.select_all(action='DESELECT')
-        collision_obj.select_set(True)
-        context.view_layer.objects.active = collision_obj
         
-        # Set layer_preset custom property
-        collision_obj["layer_preset"] = "Collision_Vehicle"
-        collision_obj["usage"] = "PhyCol"
+        for collision_obj in collision_objects:
+            # Assign material
+            if not collision_obj.data.materials:
+                collision_obj.data.materials.append(mat)
+            
+            # Set layer_preset custom property
+            collision_obj["layer_preset"] = "Collision_Vehicle"
+            collision_obj["usage"] = "PhyCol"
+            
+            # Select the collision object
+            collision_obj.select_set(True)
+        
+        context.view_layer.objects.active = collision_objects[0]
         
         # Report number of faces
-        self.report({'INFO'}, f"Created UCX collision with {len(collision_obj.data.polygons)} faces")
+        total_faces = sum(len(obj.data.polygons) for obj in collision_objects)
+        action = "Reused cached" if cached else "Created"
+        if len(collision_objects) > 1:
+            self.report({'INFO'}, f"{action} {len(collision_objects)} UCX parts with {total_faces} faces in total")
+        else:
+            self.report({'INFO'}, f"{action} UCX collision with {total_faces} faces")
         
         return {'FINISHED'}
     
+    def _cache_params(self):
+        """Settings that change the generated colliders"""
+        return (self.method, self.target_faces, self.padding, self.oriented_box,
+                self.max_parts, self.max_concavity, self.resolution)
+    
+    def _fit_hull(self, collision_mesh, max_faces):
+        """Merge hull planes down to max_faces and push them out by the padding"""
+        # The result stays a single convex shell
+        if len(collision_mesh.polygons) > max_faces or self.padding > 0:
+            if simplify_convex_hull(collision_mesh, max_faces, self.padding) == 0:
+                self.report({'WARNING'}, f"Could not simplify or pad {collision_mesh.name}, keeping the plain hull")
+    
+    def _build_box_meshes(self, mesh_objects):
+        """Build a box around all meshes, returns [(object name, mesh)] or [] if flat"""
+        corners = bounding_box_corners(mesh_objects, self.oriented_box, self.padding)
+        
+        collision_mesh = bpy.data.meshes.new("UCX_body_mesh")
+        if build_convex_hull(corners, collision_mesh, merge_coplanar=True) == 0:
+            bpy.data.meshes.remove(collision_mesh)
+            return []
+        return [("UCX_body", collision_mesh)]
+    
+    def _build_hull_meshes(self, mesh_objects):
+        """Build one hull around all meshes, returns [(object name, mesh)] or [] if flat"""
+        # Build the hull from the hull candidates of all selected meshes
+        collision_mesh = bpy.data.meshes.new("UCX_body_mesh")
+        if build_convex_hull(gather_hull_points(mesh_objects), collision_mesh) == 0:
+            bpy.data.meshes.remove(collision_mesh)
+            return []
+        
+        if self.method == 'SIMPLIFIED':
+            self._fit_hull(collision_mesh, self.target_faces)
+        else:
+            self._fit_hull(collision_mesh, len(collision_mesh.polygons))
+        return [("UCX_body", collision_mesh)]
+    
+    def _build_decomposed_meshes(self, mesh_objects):
+        """Build one hull per convex part, returns [(object name, mesh)] or [] if flat"""
+        bounds = get_world_bounds(mesh_objects)
+        longest = max(bounds[3] - bounds[0], bounds[4] - bounds[1], bounds[5] - bounds[2])
+        points = sample_mesh_surface(mesh_objects, longest / self.resolution / 2)
+        if len(points) == 0 or longest <= 0:
+            return []
+        
+        # Every part needs a few faces, so the budget caps the number of parts
+        max_parts = max(1, min(self.max_parts, self.target_faces // DECOMPOSE_MIN_PART_FACES))
+        part_points = decompose_convex_parts(points, self.resolution, max_parts, self.max_concavity)
+        
+        hull_meshes = []
+        for part in part_points:
+            collision_mesh = bpy.data.meshes.new("UCX_body_mesh")
+            if build_convex_hull(hull_candidates(part), collision_mesh) == 0:
+                bpy.data.meshes.remove(collision_mesh)
+                continue
+            hull_meshes.append(collision_mesh)
+        
+        # Larger parts get more of the face budget
+        areas = []
+        for collision_mesh in hull_meshes:
+            face_areas = np.empty(len(collision_mesh.polygons), dtype=np.float32)
+            collision_mesh.polygons.foreach_get("area", face_areas)
+            areas.append(face_areas.sum())
+        budgets = split_face_budget(areas, self.target_faces, DECOMPOSE_MIN_PART_FACES) if hull_meshes else []
+        
+        collision_meshes = []
+        for index, (collision_mesh, budget) in enumerate(zip(hull_meshes, budgets), start=1):
+            collision_mesh.name = f"UCX_body_{index:02d}_mesh"
+            self._fit_hull(collision_mesh, int(budget))
+            collision_meshes.append((f"UCX_body_{index:02d}", collision_mesh))
+        return collision_meshes
+    
     def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self)
-
+        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if mesh_objects:
+            self._probe_selection(mesh_objects)
+        return context.window_manager.invoke_props_dialog(self, width=360)
+    
+    def _probe_selection(self, mesh_objects):
+        """Time a hull on a vertex sample, the tier estimates scale up from it"""
+        start = time.perf_counter()
+        points = _sample_world_coords(mesh_objects, UCX_PROBE_POINTS)
+        candidates = hull_candidates(points)
+        
+        self.probe_faces = len(_hull_triangles(candidates)) if len(candidates) >= 4 else 0
+        self.probe_seconds = time.perf_counter() - start
+        self.probe_points = len(points)
+        self.vertex_count = sum(len(obj.data.vertices) for obj in mesh_objects)
+    
+    def _estimate(self, method):
+        """Get (seconds, faces) expected for a tier from the probe hull"""
+        hull_seconds = self.probe_seconds * self.vertex_count / max(1, self.probe_points)
+        
+        if method == 'BOX':
+            return 0.0, 6
+        if method == 'HULL':
+            return hull_seconds, self.probe_faces
+        if method == 'SIMPLIFIED':
+            merge_seconds = self.probe_faces * UCX_MERGE_SECONDS_PER_FACE if self.probe_faces > self.target_faces else 0.0
+            return hull_seconds + merge_seconds, min(self.target_faces, self.probe_faces)
+        
+        decompose_seconds = UCX_DECOMPOSE_SECONDS * (self.resolution / 40) ** 3
+        return hull_seconds + decompose_seconds, self.target_faces
+    
+    def draw(self, context):
+        layout = self.layout
+        
+        layout.prop(self, "method")
+        
+        if self.method == 'BOX':
+            layout.prop(self, "oriented_box")
+        elif self.method != 'HULL':
+            layout.prop(self, "target_faces")
+        layout.prop(self, "padding")
+        
+        if self.method == 'DECOMPOSE':
+            box = layout.box()
+            box.label(text="Convex Decomposition")
+            box.prop(self, "max_parts")
+            box.prop(self, "max_concavity")
+            box.prop(self, "resolution")
+        
+        # The redo panel has no probe, the estimates only show in the dialog
+        if self.vertex_count == 0:
+            return
+        
+        box = layout.box()
+        box.label(text=f"Estimates for {self.vertex_count:,} vertices:")
+        for identifier, name, _ in UCX_TIERS:
+            seconds, faces = self._estimate(identifier)
+            row = box.row()
+            row.active = identifier == self.method
+            row.label(text=name, icon='RIGHTARROW' if identifier == self.method else 'BLANK1')
+            row.label(text="instant" if seconds < 0.1 else f"~{seconds:.1f} s")
+            row.label(text=f"~{faces} faces")
 class ARVEHICLES_OT_create_firegeo_collision(bpy.types.Operator):
     """Create FireGeo collision (bullet penetration) for the vehicle"""
     bl_idname = "arvehicles.create_firegeo_collision"
@@ -592,7 +2738,7 @@ class ARVEHICLES_OT_create_firegeo_collision(bpy.types.Operator):
         description="Method to create FireGeo collision",
         items=[
             ('CONVEX', "Convex Hull (Stable)", "Create a simplified convex hull - stable even with high-poly models"),
-            ('DETAILED', "Detailed (Better Shape)", "Create a more detailed shape that better preserves features - may crash with very high-poly models"),
+            ('DETAILED', "Detailed (Better Shape)", "Create a more detailed shape that better preserves features"),
         ],
         default='DETAILED'
     )
@@ -621,6 +2767,20 @@ class ARVEHICLES_OT_create_firegeo_collision(bpy.types.Operator):
         default=True
     )
     
+    use_worker: bpy.props.BoolProperty(
+        name="Separate Process",
+        description="Run the Detailed method in background Blender processes, so parts are built in parallel and a failure cannot take down this session",
+        default=False
+    )
+    
+    workers: bpy.props.IntProperty(
+        name="Parallel Workers",
+        description="Background processes working on parts at the same time",
+        default=4,
+        min=1,
+        max=64
+    )
+    
     # Common parameters
     offset: bpy.props.FloatProperty(
         name="Offset",
@@ -644,218 +2804,275 @@ class ARVEHICLES_OT_create_firegeo_collision(bpy.types.Operator):
             self.report({'ERROR'}, "No mesh objects selected")
             return {'CANCELLED'}
         
-        # Check if we're dealing with a high-poly model and warn the user
-        total_faces = sum(len(obj.data.polygons) for obj in mesh_objects)
-        if total_faces > 10000 and self.method == 'DETAILED':
-            self.report({'WARNING'}, f"High-poly model detected ({total_faces} faces). Detailed method may crash. Consider using Convex Hull method instead.")
-
-        # Create a new empty object to parent the collision mesh to
-        collision_parent = bpy.data.objects.new("UTM_vehicle", None)
-        context.collection.objects.link(collision_parent)
-        
         # Based on the selected method, call the appropriate function
         if self.method == 'CONVEX':
-            self._create_convex_hull(context, mesh_objects, collision_parent)
+            # Unchanged meshes with the same settings reuse the hull of an earlier run
+            key = collider_cache_key("FireGeo", mesh_objects, self._cache_params())
+            collision_meshes = find_cached_colliders(key)
+            reused = len(collision_meshes)
+            part_sources = None
+            failed_sources = []
+            
+            if not collision_meshes:
+                collision_meshes = self._create_convex_hull(context, mesh_objects)
+                if not collision_meshes:
+                    return {'CANCELLED'}
+                store_collider_meshes(key, collision_meshes)
         else:  # DETAILED
-            self._create_detailed(context, mesh_objects, collision_parent)
-        
-        return {'FINISHED'}
-    
-    def _create_convex_hull(self, context, mesh_objects, collision_parent):
-        """Create a convex hull based FireGeo collision"""
-        
-        # Create a new object that will become our collision mesh
-        collision_mesh = bpy.data.meshes.new("UTM_vehicle_mesh_data")
-        fire_geo_obj = bpy.data.objects.new("UTM_vehicle_mesh", collision_mesh)
-        context.collection.objects.link(fire_geo_obj)
-        
-        # Get a reduced set of vertices from all objects to create a convex hull
-        all_verts = []
-        
-        for obj in mesh_objects:
-            # If too many vertices, sample them to prevent crashes
-            if len(obj.data.vertices) > 100:
-                sample_rate = min(1.0, 100 / len(obj.data.vertices))
-                for i, vert in enumerate(obj.data.vertices):
-                    if i % int(1/sample_rate) == 0:  # Sample vertices
-                        world_co = obj.matrix_world @ vert.co
-                        all_verts.append(world_co)
-            else:
-                for vert in obj.data.vertices:
-                    world_co = obj.matrix_world @ vert.co
-                    all_verts.append(world_co)
+            # Parts are cached per source mesh, only edited meshes are rebuilt
+            collision_meshes, part_sources, reused, failed_sources = self._create_detailed(context, mesh_objects)
+            if not collision_meshes:
+                self.report({'WARNING'}, "No FireGeo part could be built, the existing collision was left as it is")
+                return {'CANCELLED'}
+        
+        # A single detailed part names its parent apart from the mesh
+        if self.method == 'DETAILED' and len(collision_meshes) == 1:
+            parent_name = "UTM_vehicle_parent"
+        else:
+            parent_name = "UTM_vehicle"
         
-        # If still too many vertices, reduce further
-        if len(all_verts) > 1000:
-            step = len(all_verts) // 1000
-            all_verts = all_verts[::step]
+        # Replace the colliders of the previous run in place, under one empty
+        collision_objects = place_colliders(context, "FireGeo", mesh_objects, collision_meshes, self.as_keywords(),
+                                            parent_name, keep=failed_sources, part_sources=part_sources)
+        collision_parent = collision_objects[0].parent
         
-        # Create a temporary mesh for the convex hull
-        temp_mesh = bpy.data.meshes.new("temp_hull_mesh")
-        temp_obj = bpy.data.objects.new("temp_hull", temp_mesh)
-        context.collection.objects.link(temp_obj)
+        # Create a material for the collision mesh if it doesn't exist
+        if "FireGeo_Material" not in bpy.data.materials:
+            mat = bpy.data.materials.new(name="FireGeo_Material")
+            mat.diffuse_color = (0.0, 0.8, 0.0, 0.5)  # Semi-transparent green
+        else:
+            mat = bpy.data.materials["FireGeo_Material"]
         
-        # Fill the temporary mesh with our vertices
-        temp_mesh.from_pydata(all_verts, [], [])
-        temp_mesh.update()
+        for fire_geo_obj in collision_objects:
+            # Remove any existing materials and assign the new one
+            fire_geo_obj.data.materials.clear()
+            fire_geo_obj.data.materials.append(mat)
+            
+            # Set layer_preset custom property
+            fire_geo_obj["layer_preset"] = "Collision_Vehicle"
+            fire_geo_obj["usage"] = "FireGeo"
         
-        # Make the temp object active
+        # Select the collision parent and its children
         bpy.ops.object.select_all(action='DESELECT')
-        temp_obj.select_set(True)
-        context.view_layer.objects.active = temp_obj
-        
-        # Create convex hull
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.convex_hull()
+        collision_parent.select_set(True)
+        for fire_geo_obj in collision_objects:
+            fire_geo_obj.select_set(True)
         
-        # Return to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if self.method == 'CONVEX':
+            context.view_layer.objects.active = collision_objects[0]
+        else:
+            context.view_layer.objects.active = collision_parent
         
-        # Apply decimate to the convex hull if needed
-        if len(temp_obj.data.polygons) > self.max_faces:
-            decimate = temp_obj.modifiers.new(name="Decimate", type='DECIMATE')
-            decimate.ratio = self.max_faces / len(temp_obj.data.polygons)
-            bpy.ops.object.modifier_apply(modifier=decimate.name)
+        # Report success
+        total_faces = sum(len(obj.data.polygons) for obj in collision_objects)
+        method_name = "Convex Hull" if self.method == 'CONVEX' else "Detailed"
+        if reused == len(collision_objects):
+            message = f"Reused cached FireGeo collision with {total_faces} faces ({method_name} method)"
+        elif reused:
+            message = (f"Created FireGeo collision with {total_faces} faces ({method_name} method), "
+                       f"rebuilt {len(collision_objects) - reused} of {len(collision_objects)} parts")
+        else:
+            message = f"Created FireGeo collision with {total_faces} faces ({method_name} method)"
         
-        # Add offset if needed
-        if self.offset > 0:
-            # Apply solidify modifier
-            solidify = temp_obj.modifiers.new(name="Solidify", type='SOLIDIFY')
-            solidify.thickness = self.offset
-            solidify.offset = 1.0  # Expand outward only
-            bpy.ops.object.modifier_apply(modifier=solidify.name)
+        # Every part keeps its minimum, so many parts overshoot a small face target
+        if (self.method == 'DETAILED' and total_faces > self.target_faces
+                and DETAILED_MIN_PART_FACES * len(collision_objects) > self.target_faces):
+            self.report({'WARNING'}, message + f", over the {self.target_faces} face target because each of the "
+                                               f"{len(collision_objects)} parts keeps {DETAILED_MIN_PART_FACES} faces")
+        else:
+            self.report({'INFO'}, message)
         
-        # Transfer data to our fire geo object
-        fire_geo_obj.data = temp_obj.data.copy()
+        return {'FINISHED'}
+    
+    def _cache_params(self):
+        """Settings that change the generated colliders"""
+        return (self.method, self.max_faces, self.target_faces, self.preserve_details, self.offset)
+    
+    def _create_convex_hull(self, context, mesh_objects):
+        """Create a convex hull based FireGeo collision, returns [(object name, mesh)]"""
         
-        # Remove the temporary object
-        bpy.data.objects.remove(temp_obj)
+        # Hull candidates of all objects, thinned spatially so no outlying part is lost
+        all_verts = gather_hull_points(mesh_objects)
+        if len(all_verts) == 0:
+            self.report({'ERROR'}, "Selected meshes have no vertices")
+            return []
+        all_verts = stratified_hull_sample(all_verts, FIREGEO_HULL_POINTS)
         
-        # Create and assign material
-        if "FireGeo_Material" not in bpy.data.materials:
-            mat = bpy.data.materials.new(name="FireGeo_Material")
-            mat.diffuse_color = (0.0, 0.8, 0.0, 0.5)  # Semi-transparent green
-        else:
-            mat = bpy.data.materials["FireGeo_Material"]
+        # Build the hull on a free-standing BMesh, only hull candidates are passed on
+        collision_mesh = bpy.data.meshes.new("UTM_vehicle_mesh_data")
+        if build_convex_hull(all_verts, collision_mesh) == 0:
+            bpy.data.meshes.remove(collision_mesh)
+            self.report({'ERROR'}, "Selected meshes are flat, cannot build a convex hull")
+            return []
         
-        # Remove any existing materials and assign the new one
-        fire_geo_obj.data.materials.clear()
-        fire_geo_obj.data.materials.append(mat)
+        # Merge hull planes down to the face budget and push them out by the offset
+        if len(collision_mesh.polygons) > self.max_faces or self.offset > 0:
+            if simplify_convex_hull(collision_mesh, self.max_faces, self.offset) == 0:
+                self.report({'WARNING'}, "Could not simplify or offset the hull, keeping the plain hull")
         
-        # Parent to the collision parent
-        fire_geo_obj.parent = collision_parent
+        return [("UTM_vehicle_mesh", collision_mesh)]
+    
+    def _create_detailed(self, context, mesh_objects):
+        """Create a detailed FireGeo collision that preserves more vehicle features
         
-        # Set layer_preset custom property
-        fire_geo_obj["layer_preset"] = "Collision_Vehicle"
-        fire_geo_obj["usage"] = "FireGeo"
+        Returns [(object name, mesh)], the source object of each part, how many
+        parts came from the cache and the source objects whose part failed to build.
+        """
         
-        # Select our new objects
-        bpy.ops.object.select_all(action='DESELECT')
-        collision_parent.select_set(True)
-        fire_geo_obj.select_set(True)
-        context.view_layer.objects.active = fire_geo_obj
+        # Number parts by object name, so the same selection always gets the same names
+        mesh_objects = sorted(mesh_objects, key=lambda obj: obj.name)
+        part_names = self._part_names(context, mesh_objects)
+        geometry = [_world_triangles(obj) for obj in mesh_objects]
         
-        # Report success
-        self.report({'INFO'}, f"Created FireGeo collision with {len(fire_geo_obj.data.polygons)} faces (Convex Hull method)")
-    
-    def _create_detailed(self, context, mesh_objects, collision_parent):
-        """Create a detailed FireGeo collision that preserves more vehicle features"""
+        # Share the faces out by surface area, no part gets more than it has
+        areas = [np.linalg.norm(np.cross(coords[triangles[:, 1]] - coords[triangles[:, 0]],
+                                         coords[triangles[:, 2]] - coords[triangles[:, 0]]), axis=1).sum()
+                 for coords, triangles in geometry]
+        budgets = split_face_budget(areas, self.target_faces, DETAILED_MIN_PART_FACES,
+                                    caps=[len(triangles) for coords, triangles in geometry])
         
         # For each selected mesh, create a collision component
-        collision_objects = []
-        total_faces = 0
+        parts = []
+        jobs = []
+        reused = 0
+        
+        for idx, (source_obj, part_name) in enumerate(zip(mesh_objects, part_names)):
+            # An unchanged source keeps its part. Edits elsewhere shift every share a little,
+            # so the budget is left out of the key and only a clearly different share rebuilds
+            key = collider_cache_key("FireGeo", [source_obj], self._cache_params() + (part_name,))
+            cached = find_cached_colliders(key)
+            if cached:
+                cached_budget = cached[0][1].get("arvehicles_cache_budget", 0)
+                if abs(budgets[idx] - cached_budget) <= DETAILED_BUDGET_TOLERANCE * cached_budget:
+                    parts.append(cached[0][1])
+                    reused += 1
+                    continue
+            
+            parts.append(None)
+            jobs.append((idx, part_name, source_obj, key))
+        
+        wm = context.window_manager
+        wm.progress_begin(0, len(jobs))
         
+        if self.use_worker:
+            # A crash only loses its part, not the session
+            failed = self._run_workers(jobs, geometry, budgets, parts, wm)
+            if failed:
+                self.report({'WARNING'}, f"Worker failed on {', '.join(failed)}, their previous parts were kept")
+        else:
+            for done, (idx, part_name, source_obj, key) in enumerate(jobs):
+                # Built straight from the source data, the source object is left untouched
+                coords, triangles = geometry[idx]
+                buffers = detailed_part_buffers(coords, triangles, int(budgets[idx]),
+                                                self.preserve_details, self.offset)
+                parts[idx] = mesh_from_buffers(f"{part_name}_data", buffers)
+                wm.progress_update(done + 1)
+        
+        wm.progress_end()
+        
+        for idx, part_name, source_obj, key in jobs:
+            if parts[idx] is not None:
+                store_collider_meshes(key, [(part_name, parts[idx])])
+                parts[idx]["arvehicles_cache_budget"] = int(budgets[idx])
+        
+        # Reassemble in part order, whichever worker finished first
+        collision_meshes = [(mesh["arvehicles_cache_name"], mesh) for mesh in parts if mesh is not None]
+        part_sources = [source_obj for source_obj, mesh in zip(mesh_objects, parts) if mesh is not None]
+        failed_sources = [source_obj for idx, part_name, source_obj, key in jobs if parts[idx] is None]
+        return collision_meshes, part_sources, reused, failed_sources
+    
+    def _part_names(self, context, mesh_objects):
+        """Name each part after its position among the name-sorted sources
+        
+        A source that already has a part keeps its name, so re-running a
+        subset of the parts renames nothing.
+        """
+        existing = {}
+        for obj in context.scene.objects:
+            record = obj.get("arvehicles_collider")
+            if record and record.get("generator") == "FireGeo" and record.get("per_source"):
+                existing[record["sources"][0]] = obj.name
+        
+        taken = set(existing.values())
+        part_names = []
         for idx, source_obj in enumerate(mesh_objects):
-            # Deselect all objects
-            bpy.ops.object.select_all(action='DESELECT')
-            
-            # Select and make active the source object
-            source_obj.select_set(True)
-            context.view_layer.objects.active = source_obj
-            
-            # Duplicate the object
-            bpy.ops.object.duplicate()
-            dup_obj = context.selected_objects[0]
+            part_name = existing.get(source_obj.name)
+            if part_name is None:
+                part_name = "UTM_vehicle_mesh" if len(mesh_objects) == 1 else f"UTM_vehicle_part_{idx}"
+                # Skip names parts of other sources still hold
+                number = idx
+                while part_name in taken:
+                    number += 1
+                    part_name = f"UTM_vehicle_part_{number}"
+                taken.add(part_name)
+            part_names.append(part_name)
+        return part_names
+    
+    def _run_workers(self, jobs, geometry, budgets, parts, wm):
+        """Process jobs in up to self.workers background Blenders, filling parts by index
+        
+        Starting Blender costs far more than building a part, so the jobs are
+        split into one batch per worker, balanced by triangle count.
+        Returns the names of the source objects whose part failed.
+        """
+        batches = [[] for _ in range(min(self.workers, len(jobs)))]
+        loads = [(0, worker) for worker in range(len(batches))]
+        for job in sorted(jobs, key=lambda job: len(geometry[job[0]][1]), reverse=True):
+            load, worker = heapq.heappop(loads)
+            batches[worker].append(job)
+            heapq.heappush(loads, (load + len(geometry[job[0]][1]), worker))
+        
+        failed = []
+        running = []
+        done = 0
+        
+        # Worker jobs and results go through temporary files
+        with tempfile.TemporaryDirectory(prefix="arvehicles_") as job_dir:
+            for worker, batch in enumerate(batches):
+                try:
+                    process, result_paths = start_detailed_worker(
+                        job_dir, f"worker_{worker}",
+                        [(part_name, *geometry[idx], int(budgets[idx])) for idx, part_name, source_obj, key in batch],
+                        self.preserve_details, self.offset)
+                except OSError:
+                    # Blender could not be started at all
+                    failed.extend(source_obj.name for idx, part_name, source_obj, key in batch)
+                    done += len(batch)
+                    wm.progress_update(done)
+                    continue
+                running.append([process, list(zip(batch, result_paths)), time.monotonic() + DETAILED_WORKER_TIMEOUT])
             
-            # Rename the duplicated object
-            if len(mesh_objects) == 1:
-                dup_obj.name = "UTM_vehicle_mesh"
-            else:
-                dup_obj.name = f"UTM_vehicle_part_{idx}"
+            while running:
+                for worker in list(running):
+                    process, waiting = worker[:2]
+                    exited = process.poll() is not None
+                    
+                    # Pick up parts as they finish, each one gives the worker time for the next
+                    for entry in [entry for entry in waiting if os.path.exists(entry[1])]:
+                        waiting.remove(entry)
+                        (idx, part_name, source_obj, key), result_path = entry
+                        parts[idx] = load_detailed_result(result_path, part_name)
+                        if parts[idx] is None:
+                            failed.append(source_obj.name)
+                        worker[2] = time.monotonic() + DETAILED_WORKER_TIMEOUT
+                        done += 1
+                        wm.progress_update(done)
+                    
+                    if exited or time.monotonic() > worker[2]:
+                        if not exited:
+                            process.kill()
+                        process.wait()
+                        # Parts the worker never got to are lost with it
+                        for (idx, part_name, source_obj, key), result_path in waiting:
+                            failed.append(source_obj.name)
+                            done += 1
+                            wm.progress_update(done)
+                        running.remove(worker)
                 
-            collision_objects.append(dup_obj)
-            
-            # Simplify mesh based on preserve_details setting
-            part_target_faces = int(self.target_faces / len(mesh_objects))
-            
-            # For more complex vehicle parts, use different simplification strategy
-            if self.preserve_details and len(dup_obj.data.polygons) > part_target_faces * 2:
-                # Use remesh for better topology preservation
-                remesh = dup_obj.modifiers.new(name="Remesh", type='REMESH')
-                max_dim = max(dup_obj.dimensions)
-                remesh.voxel_size = max_dim * 0.05  # Larger voxel size for vehicles
-                bpy.ops.object.modifier_apply(modifier=remesh.name)
-            
-            # Apply decimate regardless of method
-            decimate = dup_obj.modifiers.new(name="Decimate", type='DECIMATE')
-            current_faces = len(dup_obj.data.polygons)
-            decimate.ratio = min(1.0, part_target_faces / max(1, current_faces))
-            bpy.ops.object.modifier_apply(modifier=decimate.name)
-            
-            # If offset is specified, add a solidify modifier
-            if self.offset > 0:
-                # Apply solidify modifier
-                solidify = dup_obj.modifiers.new(name="Solidify", type='SOLIDIFY')
-                solidify.thickness = self.offset
-                solidify.offset = 1.0  # Expand outward only
-                bpy.ops.object.modifier_apply(modifier=solidify.name)
-            
-            # Enter edit mode to clean up the mesh
-            bpy.ops.object.mode_set(mode='EDIT')
-            
-            # Select all vertices
-            bpy.ops.mesh.select_all(action='SELECT')
-            
-            # Remove doubles to clean up the mesh
-            bpy.ops.mesh.remove_doubles(threshold=0.001)
-            
-            # Return to object mode
-            bpy.ops.object.mode_set(mode='OBJECT')
-            
-            # Create a material for the collision mesh if it doesn't exist
-            if "FireGeo_Material" not in bpy.data.materials:
-                mat = bpy.data.materials.new(name="FireGeo_Material")
-                mat.diffuse_color = (0.0, 0.8, 0.0, 0.5)  # Semi-transparent green
-            else:
-                mat = bpy.data.materials["FireGeo_Material"]
-            
-            # Remove any existing materials and assign the new one
-            dup_obj.data.materials.clear()
-            dup_obj.data.materials.append(mat)
-            
-            # Parent to the collision parent
-            dup_obj.parent = collision_parent
-            
-            # Set layer_preset custom property
-            dup_obj["layer_preset"] = "Collision_Vehicle"
-            dup_obj["usage"] = "FireGeo"
-            
-            total_faces += len(dup_obj.data.polygons)
-        
-        # If only one mesh was selected and it's already named appropriately, rename the parent
-        if len(collision_objects) == 1:
-            collision_parent.name = "UTM_vehicle_parent"
-        
-        # Select the collision parent and its children
-        bpy.ops.object.select_all(action='DESELECT')
-        collision_parent.select_set(True)
-        for obj in collision_objects:
-            obj.select_set(True)
-        context.view_layer.objects.active = collision_parent
+                if running:
+                    time.sleep(0.05)
         
-        # Report success
-        self.report({'INFO'}, f"Created FireGeo collision with {total_faces} total faces (Detailed method)")
+        return failed
     
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self, width=350)
@@ -864,16 +3081,6 @@ class ARVEHICLES_OT_create_firegeo_collision(bpy.types.Operator):
         """Custom draw for better UI with method-specific parameters"""
         layout = self.layout
         
-        # Count faces in selected objects for warning
-        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
-        total_faces = sum(len(obj.data.polygons) for obj in mesh_objects)
-        
-        # Display warning for high-poly models
-        if total_faces > 8000:
-            box = layout.box()
-            box.label(text=f"High-poly model detected: {total_faces} faces", icon='ERROR')
-            box.label(text="'Convex Hull' method recommended for stability")
-        
         # Method selection
         layout.prop(self, "method")
         
@@ -887,9 +3094,9 @@ class ARVEHICLES_OT_create_firegeo_collision(bpy.types.Operator):
             box.label(text="Detailed Parameters:")
             box.prop(self, "target_faces")
             box.prop(self, "preserve_details")
-            
-            if total_faces > 8000:
-                box.label(text="Warning: May crash with this model", icon='ERROR')
+            box.prop(self, "use_worker")
+            if self.use_worker:
+                box.prop(self, "workers")
         
         # Common parameters
         layout.prop(self, "offset")
@@ -937,6 +3144,8 @@ class ARVEHICLES_OT_create_wheel_collisions(bpy.types.Operator):
     )
     
     def execute(self, context):
+        bounds_slack = 0.0
+        
         # Check if objects are selected to get vehicle dimensions
         if len(context.selected_objects) == 0:
             self.report({'WARNING'}, "No objects selected, using default dimensions")
@@ -961,19 +3170,9 @@ class ARVEHICLES_OT_create_wheel_collisions(bpy.types.Operator):
                 center_y = 0
                 center_z = 0
             else:
-                # Calculate current vehicle dimensions and center
-                min_x, min_y, min_z = float('inf'), float('inf'), float('inf')
-                max_x, max_y, max_z = float('-inf'), float('-inf'), float('-inf')
-                
-                for obj in mesh_objects:
-                    for vert in obj.data.vertices:
-                        world_co = obj.matrix_world @ vert.co
-                        min_x = min(min_x, world_co.x)
-                        min_y = min(min_y, world_co.y)
-                        min_z = min(min_z, world_co.z)
-                        max_x = max(max_x, world_co.x)
-                        max_y = max(max_y, world_co.y)
-                        max_z = max(max_z, world_co.z)
+                # Rough dimensions are enough for wheel placement
+                bounds, bounds_slack = get_fast_world_bounds(mesh_objects)
+                min_x, min_y, min_z, max_x, max_y, max_z = bounds
                 
                 # Calculate center and dimensions
                 center_x = (min_x + max_x) / 2
@@ -1015,7 +3214,7 @@ class ARVEHICLES_OT_create_wheel_collisions(bpy.types.Operator):
         
         if created_wheels:
             context.view_layer.objects.active = created_wheels[0]
-            self.report({'INFO'}, f"Created {len(created_wheels)} wheel collision objects")
+            self.report({'INFO'}, f"Created {len(created_wheels)} wheel collision objects" + _fast_bounds_note(bounds_slack))
         
         return {'FINISHED'}
     
@@ -1093,6 +3292,287 @@ class ARVEHICLES_OT_create_wheel_collisions(bpy.types.Operator):
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
+class ARVEHICLES_OT_create_primitive_colliders(bpy.types.Operator):
+    """Fit box, cylinder or capsule colliders to each part of the vehicle"""
+    bl_idname = "arvehicles.create_primitive_colliders"
+    bl_label = "Create Primitive Colliders"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    split_mode: bpy.props.EnumProperty(
+        name="Parts",
+        description="How the selection is split into parts",
+        items=[
+            ('OBJECT', "Per Object", "One collider per selected mesh object"),
+            ('LOOSE', "Per Loose Part", "One collider per connected piece of each mesh"),
+        ],
+        default='OBJECT'
+    )
+    
+    primitive: bpy.props.EnumProperty(
+        name="Primitive",
+        description="Collider shape fitted to each part",
+        items=[
+            ('AUTO', "Best Fit", "Use whichever shape encloses the part with the least volume"),
+            ('BOX', "Box", "Oriented box (UBX_)"),
+            ('CYLINDER', "Cylinder", "Cylinder along the best box axis (UCS_)"),
+            ('CAPSULE', "Capsule", "Capsule along the longest box axis (USP_)"),
+        ],
+        default='AUTO'
+    )
+    
+    min_size: bpy.props.FloatProperty(
+        name="Min Part Size",
+        description="Skip parts whose longest side is shorter than this (in meters)",
+        default=0.1,
+        min=0.0,
+        max=2.0
+    )
+    
+    padding: bpy.props.FloatProperty(
+        name="Padding",
+        description="Extra padding around each part (in meters)",
+        default=0.01,
+        min=0.0,
+        max=0.1,
+        step=0.001
+    )
+    
+    def execute(self, context):
+        # Check if objects are selected
+        if len(context.selected_objects) == 0:
+            self.report({'ERROR'}, "Please select the vehicle meshes")
+            return {'CANCELLED'}
+        
+        # Find all mesh objects in selection
+        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        
+        if not mesh_objects:
+            self.report({'ERROR'}, "No mesh objects selected")
+            return {'CANCELLED'}
+        
+        collider_meshes = []
+        part_sources = []
+        counts = {kind: 0 for kind in PRIMITIVE_TYPES}
+        skipped = 0
+        
+        for obj in mesh_objects:
+            # An unchanged mesh keeps its colliders
+            key = collider_cache_key("Primitive", [obj], (self.split_mode, self.primitive, self.min_size, self.padding))
+            cached = find_cached_colliders(key)
+            if cached:
+                collider_meshes.extend(cached)
+                part_sources.extend([obj] * len(cached))
+                continue
+            
+            object_meshes = []
+            for part_name, points in self._gather_parts(obj):
+                # Bolts and other small bits are not worth a collider
+                if len(points) < 4 or np.max(points.max(axis=0) - points.min(axis=0)) < self.min_size:
+                    skipped += 1
+                    continue
+                
+                kind, vertices = fit_primitive(points, self.primitive, self.padding)
+                prefix, material_name, color = PRIMITIVE_TYPES[kind]
+                
+                collider_mesh = bpy.data.meshes.new(f"{prefix}_{part_name}_mesh")
+                if build_convex_hull(vertices, collider_mesh, merge_coplanar=True) == 0:
+                    bpy.data.meshes.remove(collider_mesh)
+                    skipped += 1
+                    continue
+                
+                # Create material
+                if material_name not in bpy.data.materials:
+                    mat = bpy.data.materials.new(name=material_name)
+                    mat.diffuse_color = color
+                    
+                    # Enable transparency
+                    if hasattr(mat, 'blend_method'):
+                        mat.blend_method = 'BLEND'
+                        mat.show_transparent_back = False
+                else:
+                    mat = bpy.data.materials[material_name]
+                collider_mesh.materials.append(mat)
+                
+                object_meshes.append((f"{prefix}_{part_name}", collider_mesh))
+            
+            store_collider_meshes(key, object_meshes)
+            collider_meshes.extend(object_meshes)
+            part_sources.extend([obj] * len(object_meshes))
+        
+        if not collider_meshes:
+            self.report({'ERROR'}, "No parts large enough for a collider")
+            return {'CANCELLED'}
+        
+        # Each collider belongs to its own mesh, only the selected meshes' colliders are replaced
+        created = place_colliders(context, "Primitive", mesh_objects, collider_meshes, self.as_keywords(),
+                                  part_sources=part_sources)
+        
+        for collider in created:
+            # Count by the prefix, cached colliders were fitted in an earlier run
+            for kind, (prefix, material_name, color) in PRIMITIVE_TYPES.items():
+                if collider.name.startswith(prefix + "_"):
+                    counts[kind] += 1
+            
+            # Set layer_preset custom property
+            collider["layer_preset"] = "Collision_Vehicle"
+            collider["usage"] = "PhyCol"
+        
+        # Select the new colliders
+        bpy.ops.object.select_all(action='DESELECT')
+        for collider in created:
+            collider.select_set(True)
+        context.view_layer.objects.active = created[0]
+        
+        summary = ", ".join(f"{count} {kind.lower()}" for kind, count in counts.items() if count)
+        message = f"Created {len(created)} primitive colliders ({summary})"
+        if skipped:
+            message += f", skipped {skipped} small parts"
+        self.report({'INFO'}, message)
+        
+        return {'FINISHED'}
+    
+    def _gather_parts(self, obj):
+        """Get (name, world-space vertices) for every part of obj to fit"""
+        if len(obj.data.vertices) == 0:
+            return []
+        coords = _transform_coords(_mesh_local_coords(obj.data), obj.matrix_world)
+        
+        if self.split_mode == 'OBJECT':
+            return [(obj.name, coords)]
+        
+        edges = np.empty(len(obj.data.edges) * 2, dtype=np.int32)
+        obj.data.edges.foreach_get("vertices", edges)
+        labels = _connected_components(len(coords), edges.reshape(-1, 2).astype(np.int64))
+        
+        # Group the vertices by label
+        order = np.argsort(labels, kind='stable')
+        boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+        return [(f"{obj.name}_{index:02d}", coords[vertex_indices])
+                for index, vertex_indices in enumerate(np.split(order, boundaries), start=1)]
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+class ARVEHICLES_OT_refresh_colliders(bpy.types.Operator):
+    """Regenerate the colliders whose source meshes changed since they were created"""
+    bl_idname = "arvehicles.refresh_colliders"
+    bl_label = "Refresh Colliders"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        # Group colliders into the runs they were generated in
+        collider_sets = {}
+        for obj in context.scene.objects:
+            record = obj.get("arvehicles_collider")
+            if record and record.get("generator") in COLLIDER_OPERATORS:
+                selection = tuple(record.get("selection", record["sources"]))
+                collider_sets.setdefault((record["generator"], selection), []).append(record)
+        
+        if not collider_sets:
+            self.report({'ERROR'}, "No generated colliders in the scene")
+            return {'CANCELLED'}
+        
+        # Fingerprint each source once, sets often share them
+        fingerprints = {}
+        stale = []
+        missing = 0
+        for (generator, selection), records in collider_sets.items():
+            # Per-source colliders of a run may have been replaced by a later one, only their sources rerun
+            sources = sorted({name for record in records for name in record["sources"]})
+            source_objects = [context.scene.objects.get(name) for name in sources]
+            if any(obj is None or obj.type != 'MESH' for obj in source_objects):
+                missing += 1
+                continue
+            
+            for obj in source_objects:
+                if obj.name not in fingerprints:
+                    fingerprints[obj.name] = source_fingerprint(obj)
+            if any(fingerprints[name] != record["fingerprints"].get(name)
+                   for record in records for name in record["sources"]):
+                stale.append((generator, source_objects, records[0]["settings"].to_dict()))
+        
+        # Rerun the generators on their sources, their caches skip the unchanged parts
+        failed = 0
+        for generator, source_objects, settings in stale:
+            bpy.ops.object.select_all(action='DESELECT')
+            for obj in source_objects:
+                obj.select_set(True)
+            context.view_layer.objects.active = source_objects[0]
+            
+            operator = getattr(bpy.ops.arvehicles, COLLIDER_OPERATORS[generator])
+            if 'FINISHED' not in operator('EXEC_DEFAULT', **settings):
+                failed += 1
+        
+        message = f"Refreshed {len(stale) - failed} of {len(collider_sets)} collider sets"
+        if missing:
+            message += f", {missing} with missing source meshes"
+        if failed or missing:
+            self.report({'WARNING'}, message + (f", {failed} failed" if failed else ""))
+        else:
+            self.report({'INFO'}, message)
+        
+        return {'FINISHED'}
+
+class ARVEHICLES_OT_analyze_collider(bpy.types.Operator):
+    """Measure how far the selected colliders deviate from the visual meshes"""
+    bl_idname = "arvehicles.analyze_collider"
+    bl_label = "Analyze Collider Fit"
+    bl_options = {'REGISTER'}
+    
+    samples: bpy.props.IntProperty(
+        name="Samples",
+        description="Points sampled on each surface",
+        default=20000,
+        min=1000,
+        max=200000
+    )
+    
+    def execute(self, context):
+        # Colliders are marked by their usage, the other selected meshes are the visuals
+        selected = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        colliders = [obj for obj in selected if obj.get("usage") in ("PhyCol", "FireGeo")]
+        visuals = [obj for obj in selected if obj not in colliders]
+        
+        if not colliders:
+            self.report({'ERROR'}, "Please select the collider meshes")
+            return {'CANCELLED'}
+        
+        # Without visuals in the selection, compare against the recorded sources
+        if not visuals:
+            names = set()
+            for obj in colliders:
+                record = obj.get("arvehicles_collider")
+                if record:
+                    names.update(record["sources"])
+            visuals = [context.scene.objects[name] for name in sorted(names)
+                       if name in context.scene.objects and context.scene.objects[name].type == 'MESH']
+        
+        if not visuals:
+            self.report({'ERROR'}, "Please also select the visual meshes")
+            return {'CANCELLED'}
+        
+        visual_points = sample_surface_points(visuals, self.samples)
+        collider_points = sample_surface_points(colliders, self.samples)
+        if len(visual_points) == 0 or len(collider_points) == 0:
+            self.report({'ERROR'}, "Selected meshes have no surface")
+            return {'CANCELLED'}
+        
+        # One-sided distances both ways, their worst case is the symmetric Hausdorff distance
+        to_collider = surface_distances(visual_points, colliders)
+        to_visual = surface_distances(collider_points, visuals)
+        
+        metrics = context.scene.arvehicles_collider_metrics
+        metrics.collider = colliders[0].name if len(colliders) == 1 else f"{len(colliders)} colliders"
+        metrics.samples = self.samples
+        metrics.visual_to_collider = to_collider.max()
+        metrics.collider_to_visual = to_visual.max()
+        metrics.hausdorff = max(metrics.visual_to_collider, metrics.collider_to_visual)
+        metrics.rms = np.sqrt(np.mean(np.concatenate([to_collider, to_visual]) ** 2))
+        
+        self.report({'INFO'}, f"Hausdorff {metrics.hausdorff:.3f} m, RMS {metrics.rms:.3f} m")
+        
+        return {'FINISHED'}
+
 class ARVEHICLES_OT_create_center_of_mass(bpy.types.Operator):
     """Create center of mass object for the vehicle"""
     bl_idname = "arvehicles.create_center_of_mass"
@@ -1116,6 +3596,8 @@ class ARVEHICLES_OT_create_center_of_mass(bpy.types.Operator):
     )
     
     def execute(self, context):
+        bounds_slack = 0.0
+        
         # Calculate vehicle dimensions from selection
         if len(context.selected_objects) == 0:
             self.report({'WARNING'}, "No objects selected, using origin as center")
@@ -1130,19 +3612,9 @@ class ARVEHICLES_OT_create_center_of_mass(bpy.types.Operator):
                 center_x, center_y, center_z = 0, 0, 0
                 width, length, height = 2.0, 4.0, 1.5
             else:
-                # Calculate current vehicle dimensions and center
-                min_x, min_y, min_z = float('inf'), float('inf'), float('inf')
-                max_x, max_y, max_z = float('-inf'), float('-inf'), float('-inf')
-                
-                for obj in mesh_objects:
-                    for vert in obj.data.vertices:
-                        world_co = obj.matrix_world @ vert.co
-                        min_x = min(min_x, world_co.x)
-                        min_y = min(min_y, world_co.y)
-                        min_z = min(min_z, world_co.z)
-                        max_x = max(max_x, world_co.x)
-                        max_y = max(max_y, world_co.y)
-                        max_z = max(max_z, world_co.z)
+                # Rough dimensions are enough for the COM box
+                bounds, bounds_slack = get_fast_world_bounds(mesh_objects)
+                min_x, min_y, min_z, max_x, max_y, max_z = bounds
                 
                 # Calculate center and dimensions
                 center_x = (min_x + max_x) / 2
@@ -1166,7 +3638,7 @@ class ARVEHICLES_OT_create_center_of_mass(bpy.types.Operator):
         com_obj.select_set(True)
         context.view_layer.objects.active = com_obj
         
-        self.report({'INFO'}, "Created center of mass object")
+        self.report({'INFO'}, "Created center of mass object" + _fast_bounds_note(bounds_slack))
         return {'FINISHED'}
     
     def _create_com_box(self, name, center_x, center_y, center_z, width, length, height):
@@ -1421,7 +3893,7 @@ class ARVEHICLES_OT_create_empties(bpy.types.Operator):
         created_empties = []
         
         # Determine vehicle dimensions from selection if possible
-        dimensions, center = self._get_selected_dimensions(context)
+        dimensions, center, bounds_slack = self._get_selected_dimensions(context)
         length, width, height = dimensions
         
         # Determine number of wheels based on vehicle type
@@ -1482,7 +3954,7 @@ class ARVEHICLES_OT_create_empties(bpy.types.Operator):
                     # No bone parenting by default, user can set this up manually
         
         if created_empties:
-            self.report({'INFO'}, f"Created {len(created_empties)} empty objects")
+            self.report({'INFO'}, f"Created {len(created_empties)} empty objects" + _fast_bounds_note(bounds_slack))
         else:
             self.report({'WARNING'}, "No new empties created, they may already exist")
             
@@ -1498,32 +3970,22 @@ class ARVEHICLES_OT_create_empties(bpy.types.Operator):
         return empty
     
     def _get_selected_dimensions(self, context):
-        """Get dimensions and center of selected objects, or use defaults"""
+        """Get dimensions, center and fast-bounds slack of selected objects, or use defaults"""
         if len(context.selected_objects) > 0:
             mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
             if mesh_objects:
-                min_x, min_y, min_z = float('inf'), float('inf'), float('inf')
-                max_x, max_y, max_z = float('-inf'), float('-inf'), float('-inf')
-                
-                for obj in mesh_objects:
-                    for vert in obj.data.vertices:
-                        world_co = obj.matrix_world @ vert.co
-                        min_x = min(min_x, world_co.x)
-                        min_y = min(min_y, world_co.y)
-                        min_z = min(min_z, world_co.z)
-                        max_x = max(max_x, world_co.x)
-                        max_y = max(max_y, world_co.y)
-                        max_z = max(max_z, world_co.z)
+                bounds, bounds_slack = get_fast_world_bounds(mesh_objects)
+                min_x, min_y, min_z, max_x, max_y, max_z = bounds
                 
                 length = max_y - min_y
                 width = max_x - min_x
                 height = max_z - min_z
                 center = ((min_x + max_x) / 2, (min_y + max_y) / 2, (min_z + max_z) / 2)
                 
-                return (length, width, height), center
+                return (length, width, height), center, bounds_slack
         
         # Default dimensions and center if no selection
-        return (4.07, 1.8, 1.46), (0, 0, 0)
+        return (4.07, 1.8, 1.46), (0, 0, 0), 0.0
     
     def _generate_crew_positions(self, num_crew, dimensions, center):
         """Generate crew position empties"""
@@ -1776,7 +4238,7 @@ class ARVEHICLES_OT_setup_layer_presets(bpy.types.Operator):
                 obj["layer_preset"] = "Collision_Vehicle"
                 obj["usage"] = "FireGeo"
                 updated_count += 1
-            elif obj.name.startswith("UCS_") or obj.name.startswith("USP_"):
+            elif obj.name.startswith("UBX_") or obj.name.startswith("UCS_") or obj.name.startswith("USP_"):
                 obj["layer_preset"] = "Collision_Vehicle"
                 obj["usage"] = "PhyCol"
                 updated_count += 1
@@ -1792,6 +4254,21 @@ class ARVEHICLES_OT_setup_layer_presets(bpy.types.Operator):
             
         return {'FINISHED'}
 
+class ARVEHICLES_OT_bake_transforms(bpy.types.Operator):
+    """Bake rotation and scale left pending by deferred Orient/Scale into the meshes"""
+    bl_idname = "arvehicles.bake_transforms"
+    bl_label = "Bake Pending Transforms"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        baked = bake_pending_transforms(context.scene.objects)
+        
+        if baked == 0:
+            self.report({'INFO'}, "No pending transforms to bake")
+        else:
+            self.report({'INFO'}, f"Baked pending transforms of {baked} objects")
+        return {'FINISHED'}
+
 class ARVEHICLES_OT_setup_export(bpy.types.Operator):
     """Setup FBX export settings for Arma Reforger"""
     bl_idname = "arvehicles.setup_export"
@@ -1803,7 +4280,13 @@ class ARVEHICLES_OT_setup_export(bpy.types.Operator):
         # These would be reflected in Blender's FBX export dialog
         # We're just displaying tips here
         
-        self.report({'INFO'}, "FBX export settings configured")
+        # Deferred Orient/Scale transforms must be in the mesh data before export
+        baked = bake_pending_transforms(context.scene.objects)
+        
+        if baked:
+            self.report({'INFO'}, f"FBX export settings configured, baked pending transforms of {baked} objects")
+        else:
+            self.report({'INFO'}, "FBX export settings configured")
         return {'FINISHED'}
     
     def invoke(self, context, event):
@@ -1828,6 +4311,10 @@ class ARVEHICLES_OT_setup_export(bpy.types.Operator):
         
         box.label(text="Orient along Y+ axis in Blender!")
         box.label(text="File > Export > FBX (.fbx)")
+        
+        pending = len(get_pending_bake_objects(context.scene.objects))
+        if pending:
+            box.label(text=f"{pending} objects have pending transforms, they are baked on OK", icon='INFO')
 
 class ARVEHICLES_PT_panel(bpy.types.Panel):
     """Arma Reforger Vehicles Panel"""
@@ -1845,6 +4332,11 @@ class ARVEHICLES_PT_panel(bpy.types.Panel):
         box.label(text="Preparation", icon='AUTO')
         box.operator("arvehicles.orient_vehicle", icon='ORIENTATION_VIEW')
         box.operator("arvehicles.scale_vehicle", icon='FULLSCREEN_ENTER')
+        box.operator("arvehicles.batch_prepare", icon='OUTLINER_COLLECTION')
+        
+        pending = len(get_pending_bake_objects(context.scene.objects))
+        if pending:
+            box.operator("arvehicles.bake_transforms", text=f"Bake Pending Transforms ({pending})", icon='CHECKMARK')
         
         # Component Separation
         box = layout.box()
@@ -1868,6 +4360,25 @@ class ARVEHICLES_PT_panel(bpy.types.Panel):
         col = box.column(align=True)
         col.operator("arvehicles.create_wheel_collisions", icon='MESH_CYLINDER')
         
+        # Primitive Colliders
+        col = box.column(align=True)
+        col.operator("arvehicles.create_primitive_colliders", icon='MESH_CAPSULE')
+        
+        # Refresh Colliders
+        col = box.column(align=True)
+        col.operator("arvehicles.refresh_colliders", icon='FILE_REFRESH')
+        
+        # Collider Analysis
+        col = box.column(align=True)
+        col.operator("arvehicles.analyze_collider", icon='DRIVER_DISTANCE')
+        metrics = context.scene.arvehicles_collider_metrics
+        if metrics.collider:
+            col.label(text=f"{metrics.collider} ({metrics.samples} samples)")
+            col.prop(metrics, "visual_to_collider", emboss=False)
+            col.prop(metrics, "collider_to_visual", emboss=False)
+            col.prop(metrics, "hausdorff", emboss=False)
+            col.prop(metrics, "rms", emboss=False)
+        
         # Center of Mass
         col = box.column(align=True)
         col.operator("arvehicles.create_center_of_mass", icon='SPHERE')
@@ -1896,14 +4407,21 @@ class ARVEHICLES_PT_panel(bpy.types.Panel):
 classes = (
     ARVEHICLES_OT_orient_vehicle,
     ARVEHICLES_OT_scale_vehicle,
+    ARVEHICLES_PG_batch_collection,
+    ARVEHICLES_PG_collider_metrics,
+    ARVEHICLES_OT_batch_prepare,
     ARVEHICLES_OT_create_ucx_collision,
     ARVEHICLES_OT_create_firegeo_collision,
     ARVEHICLES_OT_create_wheel_collisions,
+    ARVEHICLES_OT_create_primitive_colliders,
+    ARVEHICLES_OT_refresh_colliders,
+    ARVEHICLES_OT_analyze_collider,
     ARVEHICLES_OT_create_center_of_mass,
     ARVEHICLES_OT_create_vehicle_armature,
     ARVEHICLES_OT_create_empties,
     ARVEHICLES_OT_separate_components,
     ARVEHICLES_OT_parent_to_armature,
+    ARVEHICLES_OT_bake_transforms,
     
     ARVEHICLES_OT_setup_export,
     ARVEHICLES_PT_panel,
@@ -1912,10 +4430,36 @@ classes = (
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    
+    # Registered (not custom) property, so the FBX exporter does not write it out
+    bpy.types.Object.arvehicles_pending_bake = bpy.props.BoolProperty(
+        name="Pending Transform Bake",
+        description="Rotation and scale from a deferred Orient/Scale still need to be baked into the mesh",
+        default=False
+    )
+    
+    bpy.types.Scene.arvehicles_collider_metrics = bpy.props.PointerProperty(type=ARVEHICLES_PG_collider_metrics)
+    
+    bpy.app.handlers.depsgraph_update_post.append(_bounds_cache_depsgraph_update)
+    bpy.app.handlers.load_post.append(_bounds_cache_load_post)
 
 def unregister():
+    if _bounds_cache_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_bounds_cache_load_post)
+    if _bounds_cache_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_bounds_cache_depsgraph_update)
+    invalidate_bounds_cache()
+    
+    del bpy.types.Scene.arvehicles_collider_metrics
+    del bpy.types.Object.arvehicles_pending_bake
+    set_scale_preview(None)
+    
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
 if __name__ == "__main__":
-    register()
+    # Started by start_detailed_worker as a background Blender
+    if DETAILED_WORKER_FLAG in sys.argv:
+        run_detailed_worker(sys.argv[sys.argv.index(DETAILED_WORKER_FLAG) + 1])
+    else:
+        register()